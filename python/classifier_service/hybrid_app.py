@@ -3,14 +3,24 @@ Hybrid LLM Router Classifier Service
 Combines rule-based classification with ML models for enhanced accuracy
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+import msgspec
 import numpy as np
+import torch
+import asyncio
 import os
 import re
+import json
 import ssl
 import logging
-from typing import Dict, List, Optional, Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import ahocorasick
+from numba import njit
+from cachetools import TTLCache
+from typing import Dict, List, Optional, Any, Annotated
 import warnings
 
 # Suppress warnings
@@ -25,27 +35,60 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# ML model configuration
+# ML_BACKEND selects the encoder: "onnx" (default), "onnx-e2e", "openvino", "model2vec" or "torch".
+# OV_BACKEND=1 selects OpenVINO on Intel CPUs: on Sapphire Rapids the int8
+# MatMuls are lowered to AMX tile instructions, older CPUs fall back to VNNI.
+# model2vec replaces the transformer with a static embedding lookup + mean.
+# torch is the plain PyTorch FP32 path, for hosts without the int8 runtimes.
+# onnx-e2e runs tokenizer, qint8 encoder, pooling and L2 norm as one ORT graph.
+ML_BACKEND = os.environ.get("ML_BACKEND", "openvino" if os.environ.get("OV_BACKEND") == "1" else "onnx")
+MODEL_NAME = "minishlab/potion-base-8M" if ML_BACKEND == "model2vec" else "all-MiniLM-L6-v2"
+ONNX_MODEL_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+ONNX_E2E_MODEL_FILE = "model_e2e.onnx"
+OPENVINO_MODEL_FILE = "openvino/openvino_model_qint8_quantized.xml"
+# First start exports the ONNX graphs here so later starts skip the PyTorch load
+ONNX_CACHE_DIR = os.environ.get("ONNX_CACHE_DIR", "./onnx-cache")
+# Intra-op threads per encode, sized to the container's CPU quota rather than nproc
+ML_NUM_THREADS = int(os.environ.get("TORCH_NUM_THREADS", "4"))
+# TORCH_BF16=1 runs the torch backend under bf16 autocast; only worth it on
+# CPUs with AVX512_BF16 or AMX-BF16 (Cooper Lake, Sapphire Rapids and later)
+TORCH_BF16 = ML_BACKEND == "torch" and os.environ.get("TORCH_BF16") == "1"
+# Router prompts are short; attention cost grows quadratically with sequence length
+ML_MAX_SEQ_LENGTH = int(os.environ.get("ML_MAX_SEQ_LENGTH", "64"))
+
+# Reference embeddings precomputed at build time by precompute_refs.py
+CATEGORY_EMBEDDINGS_PATH = "category_embeddings.npy"
+CATEGORY_LABELS_PATH = "category_labels.json"
+
+# Micro-batching configuration
+EMBED_BATCH_SIZE = 32
+EMBED_BATCH_WINDOW = 0.02  # seconds to wait for concurrent prompts
+
+# Classification result cache for repeated prompts
+CLASSIFY_CACHE_SIZE = 10_000
+CLASSIFY_CACHE_TTL = 3600  # seconds
+
+# Skip the ML model when the rule scores already have a clear winner
+RULE_SHORTCUT_RATIO = 2.0  # best score vs. runner-up
+RULE_SHORTCUT_CONFIDENCE = 0.7
+
 # Global variables
 sentence_model = None
 category_embeddings = None
 category_labels = []
+category_int8 = None
+category_scales = None
+embed_pool: Optional[ThreadPoolExecutor] = None
+similarity_buffers = threading.local()
+classification_cache = TTLCache(maxsize=CLASSIFY_CACHE_SIZE, ttl=CLASSIFY_CACHE_TTL)
+classification_cache_lock = threading.Lock()
+
+# Models (msgspec structs are validated in C)
+class ClassificationRequest(msgspec.Struct):
+    prompt: Annotated[str, msgspec.Meta(description="The prompt to classify")]
 
-# Models
-class ClassificationRequest(BaseModel):
-    prompt: str = Field(..., description="The prompt to classify")
-
-class HybridResponse(BaseModel):
-    primary_use_case: str = Field(..., description="Main category of the prompt")
-    complexity_score: float = Field(..., ge=0.0, le=1.0, description="Complexity score")
-    creativity_score: float = Field(..., ge=0.0, le=1.0, description="Creativity score")
-    token_count_estimate: int = Field(..., description="Estimated token count")
-    urgency_level: float = Field(..., ge=0.0, le=1.0, description="Time sensitivity")
-    output_length_estimate: int = Field(..., description="Estimated response length")
-    interaction_style: str = Field(..., description="Communication style")
-    domain_confidence: float = Field(..., ge=0.0, le=1.0, description="Classification confidence")
-    difficulty: str = Field(..., description="Difficulty: easy, medium, hard")
-    classification_method: str = Field(..., description="Method used: rule-based, ml-based, or hybrid")
-    ml_confidence: Optional[float] = Field(None, description="ML model confidence if available")
+request_decoder = msgspec.json.Decoder(ClassificationRequest)
 
 # Reference categories for ML training
 REFERENCE_CATEGORIES = {
@@ -100,13 +143,237 @@ REFERENCE_CATEGORIES = {
     ]
 }
 
-def initialize_ml_model():
+def export_onnx_cache(model_path: str):
+    """Export the model to ONNX once and bake in the qint8 AVX512-VNNI variant"""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    
+    logger.info(f"Exporting {model_path} to ONNX cache at {ONNX_CACHE_DIR}...")
+    model = SentenceTransformer(model_path, backend="onnx", trust_remote_code=True)
+    model.save_pretrained(ONNX_CACHE_DIR)
+    
+    # Written last, so its presence marks a complete cache
+    export_dynamic_quantized_onnx_model(model, "avx512_vnni", ONNX_CACHE_DIR)
+
+def export_e2e_onnx(model_path: str):
+    """Fuse tokenizer, qint8 encoder, mean pooling and L2 norm into one ONNX graph"""
+    import onnx
+    from onnx import TensorProto, helper
+    from onnxruntime_extensions import gen_processing_models
+    from transformers import AutoTokenizer
+    
+    if not os.path.exists(os.path.join(ONNX_CACHE_DIR, ONNX_MODEL_FILE)):
+        export_onnx_cache(model_path)
+    
+    logger.info(f"Building fused ONNX graph at {ONNX_CACHE_DIR}/{ONNX_E2E_MODEL_FILE}...")
+    tokenizer = AutoTokenizer.from_pretrained(ONNX_CACHE_DIR)
+    encoder = onnx.load(os.path.join(ONNX_CACHE_DIR, ONNX_MODEL_FILE))
+    opset = next(o.version for o in encoder.opset_import if o.domain in ("", "ai.onnx"))
+    encoder_inputs = [i.name for i in encoder.graph.input]
+    hidden_state = encoder.graph.output[0].name
+    
+    # Tokenizer op: one string in, 1-D token tensors out
+    pre, _ = gen_processing_models(tokenizer, pre_kwargs={}, opset=opset)
+    pre.ir_version = encoder.ir_version
+    for node in pre.graph.node:
+        if node.op_type == "BertTokenizer":
+            # Truncates like SentenceTransformer, keeping the trailing [SEP]
+            node.attribute.append(helper.make_attribute("max_length", ML_MAX_SEQ_LENGTH))
+    
+    # Add the batch axis the encoder expects
+    pre.graph.initializer.append(helper.make_tensor("batch_axis", TensorProto.INT64, [1], [0]))
+    for output in pre.graph.output:
+        if output.name not in encoder_inputs:
+            continue
+        for node in pre.graph.node:
+            node.output[:] = [f"{name}_1d" if name == output.name else name for name in node.output]
+        pre.graph.node.append(helper.make_node("Unsqueeze", [f"{output.name}_1d", "batch_axis"], [output.name]))
+        output.type.tensor_type.shape.dim.insert(0, onnx.TensorShapeProto.Dimension(dim_value=1))
+    
+    model = onnx.compose.merge_models(
+        pre, encoder,
+        io_map=[(name, name) for name in encoder_inputs],
+        outputs=[hidden_state]
+    )
+    
+    # A single unpadded sequence, so mean pooling is a plain mean over tokens
+    if opset >= 18:
+        model.graph.initializer.append(helper.make_tensor("token_axis", TensorProto.INT64, [1], [1]))
+        pool = helper.make_node("ReduceMean", [hidden_state, "token_axis"], ["pooled"], keepdims=0)
+    else:
+        pool = helper.make_node("ReduceMean", [hidden_state], ["pooled"], axes=[1], keepdims=0)
+    model.graph.node.extend([
+        pool,
+        helper.make_node("LpNormalization", ["pooled"], ["sentence_embedding"], axis=-1, p=2)
+    ])
+    del model.graph.output[:]
+    model.graph.output.append(
+        helper.make_tensor_value_info("sentence_embedding", TensorProto.FLOAT, [1, None])
+    )
+    
+    onnx.checker.check_model(model)
+    onnx.save(model, os.path.join(ONNX_CACHE_DIR, ONNX_E2E_MODEL_FILE))
+
+def ort_session_options():
+    """Pin ONNX Runtime to ML_NUM_THREADS intra-op threads"""
+    import onnxruntime
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = ML_NUM_THREADS
+    session_options.inter_op_num_threads = 1
+    return session_options
+
+class OnnxEncoder:
+    """qint8 ONNX encoder fed straight from the Rust tokenizer.
+
+    Token buffers for a full batch are allocated once per encode worker and
+    reused; each batch is padded to its longest prompt and run as a
+    contiguous [batch, seq] view of those buffers.
+    """
+    
+    def __init__(self, model_dir: str, pool_size: int):
+        import onnxruntime
+        from transformers import AutoTokenizer
+        
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, ONNX_MODEL_FILE),
+            ort_session_options(),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        
+        # Padding and truncation are set once; changing them later isn't thread-safe
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir).backend_tokenizer
+        self.tokenizer.enable_truncation(max_length=ML_MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding()
+        
+        self.buffers = queue.SimpleQueue()
+        for _ in range(pool_size):
+            self.buffers.put({
+                name: np.zeros(EMBED_BATCH_SIZE * ML_MAX_SEQ_LENGTH, dtype=np.int64)
+                for name in self.input_names
+            })
+    
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into L2-normalized mean-pooled embeddings"""
+        return np.vstack([
+            self._encode_batch(texts[i:i + EMBED_BATCH_SIZE])
+            for i in range(0, len(texts), EMBED_BATCH_SIZE)
+        ])
+    
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        batch, seq_len = len(encodings), len(encodings[0].ids)
+        
+        buffers = self.buffers.get()
+        try:
+            feeds = {
+                name: buffer[:batch * seq_len].reshape(batch, seq_len)
+                for name, buffer in buffers.items()
+            }
+            for row, encoding in enumerate(encodings):
+                feeds["input_ids"][row] = encoding.ids
+                feeds["attention_mask"][row] = encoding.attention_mask
+                if "token_type_ids" in feeds:
+                    feeds["token_type_ids"][row] = encoding.type_ids
+            
+            hidden = self.session.run(None, feeds)[0]
+            mask = feeds["attention_mask"].astype(np.float32)
+        finally:
+            self.buffers.put(buffers)
+        
+        # Mean pooling over real tokens, then L2 normalization
+        pooled = np.einsum('bsh,bs->bh', hidden, mask) / mask.sum(axis=1, keepdims=True)
+        return pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+
+def load_sentence_model(model_path: str):
+    """Load the sentence encoder on the configured backend"""
+    if ML_BACKEND == "model2vec":
+        from model2vec import StaticModel
+        return StaticModel.from_pretrained(model_path)
+    
+    if ML_BACKEND == "onnx-e2e":
+        import onnxruntime
+        from onnxruntime_extensions import get_library_path
+        
+        e2e_path = os.path.join(ONNX_CACHE_DIR, ONNX_E2E_MODEL_FILE)
+        if not os.path.exists(e2e_path):
+            export_e2e_onnx(model_path)
+        
+        session_options = ort_session_options()
+        session_options.register_custom_ops_library(get_library_path())
+        return onnxruntime.InferenceSession(e2e_path, session_options, providers=["CPUExecutionProvider"])
+    
+    # Both quantized exports run the MatMul layers as int8 dot products
+    if ML_BACKEND == "onnx":
+        if not os.path.exists(os.path.join(ONNX_CACHE_DIR, ONNX_MODEL_FILE)):
+            export_onnx_cache(model_path)
+        
+        # One token buffer set per encode worker
+        return OnnxEncoder(ONNX_CACHE_DIR, embed_pool_size())
+    
+    from sentence_transformers import SentenceTransformer
+    
+    if ML_BACKEND == "torch":
+        model = SentenceTransformer(model_path, trust_remote_code=True)
+        model.max_seq_length = ML_MAX_SEQ_LENGTH
+        return model
+    
+    model = SentenceTransformer(
+        model_path,
+        backend="openvino",
+        model_kwargs={
+            "file_name": OPENVINO_MODEL_FILE,
+            "ov_config": {"INFERENCE_NUM_THREADS": str(ML_NUM_THREADS)}
+        },
+        trust_remote_code=True
+    )
+    
+    # Longer prompts are truncated; their leading tokens carry the intent
+    model.max_seq_length = ML_MAX_SEQ_LENGTH
+    return model
+
+def reference_examples() -> tuple:
+    """Flatten REFERENCE_CATEGORIES into parallel example/label lists"""
+    all_examples = []
+    labels = []
+    
+    for category, examples in REFERENCE_CATEGORIES.items():
+        for example in examples:
+            all_examples.append(example)
+            labels.append(category)
+    
+    return all_examples, labels
+
+def load_precomputed_embeddings() -> tuple:
+    """Memory-map build-time reference embeddings if they match the active model"""
+    try:
+        with open(CATEGORY_LABELS_PATH, 'r') as f:
+            metadata = json.load(f)
+        
+        all_examples, labels = reference_examples()
+        if (metadata.get("model") != MODEL_NAME or
+            metadata.get("backend") != ML_BACKEND or
+            metadata.get("examples") != all_examples):
+            logger.info("Precomputed reference embeddings are stale, re-encoding")
+            return None, []
+        
+        embeddings = np.load(CATEGORY_EMBEDDINGS_PATH, mmap_mode='r')
+        if embeddings.shape[0] != len(labels):
+            return None, []
+        
+        return embeddings, labels
+        
+    except FileNotFoundError:
+        return None, []
+    except Exception as e:
+        logger.warning(f"Failed to load precomputed reference embeddings: {e}")
+        return None, []
+
+def initialize_ml_model(use_precomputed: bool = True):
     """Initialize sentence transformer model with SSL handling"""
-    global sentence_model, category_embeddings, category_labels
+    global sentence_model, category_embeddings, category_labels, category_int8, category_scales
     
     try:
         # Configure SSL context to be more permissive
-        import ssl
         ssl._create_default_https_context = ssl._create_unverified_context
         
         # Also set environment variables to disable SSL verification
@@ -114,35 +381,40 @@ def initialize_ml_model():
         os.environ['REQUESTS_CA_BUNDLE'] = ''
         os.environ['SSL_VERIFY'] = 'false'
         
+        # Cap PyTorch threads; single-batch latency gains nothing from inter-op parallelism
+        torch.set_num_threads(ML_NUM_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Already fixed once inter-op work has started
+        
         logger.info("Attempting to load sentence transformer model...")
-        from sentence_transformers import SentenceTransformer
         
         # Try loading from local directory first, then fallback to remote
-        local_model_path = './all-MiniLM-L6-v2'
+        local_model_path = f'./{MODEL_NAME.split("/")[-1]}'
         try:
-            sentence_model = SentenceTransformer(local_model_path)
-            logger.info("✅ Successfully loaded LOCAL ML model: all-MiniLM-L6-v2")
+            sentence_model = load_sentence_model(local_model_path)
+            logger.info(f"✅ Successfully loaded LOCAL ML model: {MODEL_NAME} ({ML_BACKEND})")
         except Exception as e:
             logger.info(f"Local model not found ({e}), trying remote download...")
-            sentence_model = SentenceTransformer('all-MiniLM-L6-v2', trust_remote_code=True)
-            logger.info("✅ Successfully loaded REMOTE ML model: all-MiniLM-L6-v2")
+            sentence_model = load_sentence_model(MODEL_NAME)
+            logger.info(f"✅ Successfully loaded REMOTE ML model: {MODEL_NAME} ({ML_BACKEND})")
         
-        # Prepare category embeddings
-        all_examples = []
-        category_labels = []
+        # Prefer the build-time embeddings, paged in lazily via mmap
+        category_embeddings = None
+        if use_precomputed:
+            category_embeddings, category_labels = load_precomputed_embeddings()
         
-        for category, examples in REFERENCE_CATEGORIES.items():
-            for example in examples:
-                all_examples.append(example)
-                category_labels.append(category)
+        if category_embeddings is not None:
+            logger.info(f"✅ Loaded precomputed embeddings for {len(category_labels)} reference examples")
+        else:
+            # Generate embeddings
+            all_examples, category_labels = reference_examples()
+            category_embeddings = encode_texts(all_examples)
+            logger.info(f"✅ Generated embeddings for {len(all_examples)} reference examples")
         
-        # Generate embeddings
-        category_embeddings = sentence_model.encode(
-            all_examples, 
-            convert_to_numpy=True, 
-            normalize_embeddings=True
-        )
-        logger.info(f"✅ Generated embeddings for {len(all_examples)} reference examples")
+        # Quantize the reference matrix for the int8 similarity matvec
+        category_int8, category_scales = quantize_int8(category_embeddings)
         return True
         
     except Exception as e:
@@ -151,41 +423,194 @@ def initialize_ml_model():
         sentence_model = None
         category_embeddings = None
         category_labels = []
+        category_int8 = None
+        category_scales = None
         return False
 
+def quantize_int8(vectors: np.ndarray) -> tuple:
+    """Symmetric per-row int8 quantization, returns (int8 values, float32 row scales)"""
+    vectors = np.atleast_2d(vectors)
+    scales = np.maximum(np.max(np.abs(vectors), axis=1) / 127.0, 1e-12).astype(np.float32)
+    quantized = np.ascontiguousarray(np.round(vectors / scales[:, None]), dtype=np.int8)
+    return quantized, scales
+
+def encode_texts(texts: List[str]) -> np.ndarray:
+    """Encode texts into L2-normalized embeddings"""
+    if ML_BACKEND == "onnx":
+        return sentence_model.encode(texts)
+    
+    if ML_BACKEND == "model2vec":
+        embeddings = sentence_model.encode(texts, batch_size=EMBED_BATCH_SIZE)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+    
+    if ML_BACKEND == "onnx-e2e":
+        # The fused graph takes one string per run; two would be read as a sentence pair
+        return np.vstack([
+            sentence_model.run(["sentence_embedding"], {"text": np.array([text])})[0]
+            for text in texts
+        ])
+    
+    # Tokenization and pooling run in torch on every other backend
+    with torch.inference_mode(), torch.autocast(device_type="cpu", dtype=torch.bfloat16, enabled=TORCH_BF16):
+        return sentence_model.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+class EmbeddingBatcher:
+    """Coalesces concurrent prompts into a single batched encode call"""
+    
+    def __init__(self, max_batch_size: int = EMBED_BATCH_SIZE, max_wait: float = EMBED_BATCH_WINDOW):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._pending = set()
+    
+    def start(self, executor: ThreadPoolExecutor):
+        """Start the consumer task on the running event loop"""
+        self.executor = executor
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+    
+    async def submit(self, prompt: str) -> np.ndarray:
+        """Queue a prompt and wait for its embedding"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((prompt, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            
+            # Drain until the batch is full or the coalescing window closes
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Keep draining while the pool encodes; the pool size bounds concurrency
+            task = asyncio.create_task(self._encode(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+    
+    async def _encode(self, batch: list):
+        loop = asyncio.get_running_loop()
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            embeddings = await loop.run_in_executor(self.executor, encode_texts, prompts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+embedding_batcher = EmbeddingBatcher()
+
+def embed_pool_size() -> int:
+    """Size the encode pool so workers x intra-op threads fit the CPU budget"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return max(1, cpus // ML_NUM_THREADS)
+
 def estimate_tokens(text: str) -> int:
     """Estimate token count"""
     return int(len(text.split()) * 1.3)
 
-def classify_with_rules(prompt: str) -> tuple:
-    """Rule-based classification"""
-    prompt_lower = prompt.lower()
-    
-    # Define keyword patterns
-    patterns = {
-        "coding": ['function', 'class', 'code', 'program', 'script', 'debug', 'algorithm', 'python', 'javascript', 'api', 'database', 'sql'],
-        "creative_writing": ['story', 'poem', 'creative', 'write', 'imagine', 'fictional', 'character', 'plot', 'narrative', 'dialogue'],
-        "analysis": ['analyze', 'compare', 'evaluate', 'assess', 'review', 'examine', 'research', 'study', 'pros and cons'],
-        "math": ['calculate', 'solve', 'equation', 'formula', 'mathematical', 'probability', 'statistics', 'derivative', 'integral'],
-        "question": ['what', 'how', 'why', 'when', 'where', 'which'],
-        "chat": ['hey', 'hi', 'hello', 'chat', 'talk', 'conversation'],
-        "general": ['explain', 'tell me', 'describe', 'overview', 'information']
-    }
+# Rule-based keyword patterns
+RULE_PATTERNS = {
+    "coding": ['function', 'class', 'code', 'program', 'script', 'debug', 'algorithm', 'python', 'javascript', 'api', 'database', 'sql'],
+    "creative_writing": ['story', 'poem', 'creative', 'write', 'imagine', 'fictional', 'character', 'plot', 'narrative', 'dialogue'],
+    "analysis": ['analyze', 'compare', 'evaluate', 'assess', 'review', 'examine', 'research', 'study', 'pros and cons'],
+    "math": ['calculate', 'solve', 'equation', 'formula', 'mathematical', 'probability', 'statistics', 'derivative', 'integral'],
+    "question": ['what', 'how', 'why', 'when', 'where', 'which'],
+    "chat": ['hey', 'hi', 'hello', 'chat', 'talk', 'conversation'],
+    "general": ['explain', 'tell me', 'describe', 'overview', 'information']
+}
+QUESTION_STARTERS = tuple(RULE_PATTERNS["question"])
+
+# Keyword indicators used by calculate_other_metrics
+METRIC_PATTERNS = {
+    "tech": ['algorithm', 'optimization', 'implementation', 'architecture', 'methodology'],
+    "creative": ['imagine', 'creative', 'story', 'unique', 'original'],
+    "chat_open": ['hey', 'hi', 'chat', 'talk']
+}
+KEYWORD_BUCKETS = {**RULE_PATTERNS, **METRIC_PATTERNS}
+
+# Fixed bucket indexes; rule categories come first so hits[:N_CATEGORIES] are the rule scores
+CATEGORIES = tuple(RULE_PATTERNS)
+N_CATEGORIES = len(CATEGORIES)
+BUCKET_IDX = {bucket: i for i, bucket in enumerate(KEYWORD_BUCKETS)}
+QUESTION_IDX = BUCKET_IDX["question"]
+TECH_IDX = BUCKET_IDX["tech"]
+CREATIVE_IDX = BUCKET_IDX["creative"]
+CHAT_OPEN_IDX = BUCKET_IDX["chat_open"]
+
+def build_keyword_automaton(buckets: Dict[str, List[str]]) -> ahocorasick.Automaton:
+    """Compile bucketed keywords into an Aho-Corasick automaton emitting (bucket index, keyword) tags"""
+    # A keyword can belong to several buckets (e.g. "story" is both a rule and a creative word)
+    tags: Dict[str, list] = {}
+    for bucket, keywords in buckets.items():
+        for keyword in keywords:
+            tags.setdefault(keyword, []).append((BUCKET_IDX[bucket], keyword))
     
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_tags in tags.items():
+        automaton.add_word(keyword, tuple(keyword_tags))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton(KEYWORD_BUCKETS)
+
+def scan_keywords(prompt_lower: str) -> List[int]:
+    """Count distinct keyword hits per bucket index in a single pass over the prompt"""
+    matched = set()
+    for _, keyword_tags in KEYWORD_AUTOMATON.iter(prompt_lower):
+        matched.update(keyword_tags)
+    
+    hits = [0] * len(BUCKET_IDX)
+    for bucket_idx, _ in matched:
+        hits[bucket_idx] += 1
+    return hits
+
+def classify_with_rules(prompt_lower: str, keyword_hits: List[int]) -> tuple:
+    """Rule-based classification from the per-bucket keyword hits.
+
+    Returns the category, its confidence and the ratio of the best score to
+    the runner-up.
+    """
     # Calculate scores for each category
-    scores = {}
-    for category, keywords in patterns.items():
-        score = sum(1 for keyword in keywords if keyword in prompt_lower)
-        if category == "question" and any(prompt_lower.startswith(word) for word in keywords):
-            score += 2  # Boost for question starters
-        scores[category] = score
+    scores = keyword_hits[:N_CATEGORIES]
+    if prompt_lower.startswith(QUESTION_STARTERS):
+        scores[QUESTION_IDX] += 2  # Boost for question starters
+    
+    # Find best category (first maximum wins, as before)
+    max_score = max(scores)
+    best_idx = scores.index(max_score)
+    best_category = CATEGORIES[best_idx]
     
-    # Find best category
-    best_category = max(scores.keys(), key=lambda x: scores[x])
-    max_score = scores[best_category]
+    # How far ahead the winner is of the runner-up
+    second_score = max(scores[:best_idx] + scores[best_idx + 1:])
+    top2_ratio = max_score / second_score if second_score else float("inf")
     
     # Calculate confidence based on score distribution
-    total_score = sum(scores.values())
+    total_score = sum(scores)
     if total_score == 0:
         confidence = 0.5
         best_category = "general"
@@ -194,28 +619,38 @@ def classify_with_rules(prompt: str) -> tuple:
         # Apply minimum confidence threshold
         confidence = max(confidence, 0.3)
     
-    return best_category, confidence
+    return best_category, confidence, top2_ratio
+
+def get_similarity_buffers(size: int) -> tuple:
+    """Per-thread (int32 dot, float32 similarity) output buffers reused across requests"""
+    buffers = getattr(similarity_buffers, 'value', None)
+    if buffers is None or buffers[0].shape[0] != size:
+        buffers = (np.empty(size, dtype=np.int32), np.empty(size, dtype=np.float32))
+        similarity_buffers.value = buffers
+    return buffers
 
-def classify_with_ml(prompt: str) -> tuple:
+async def classify_with_ml(prompt: str) -> tuple:
     """ML-based classification using sentence transformers"""
-    if sentence_model is None or category_embeddings is None:
+    if sentence_model is None or category_int8 is None:
         return None, 0.0
     
     try:
-        # Generate prompt embedding
-        prompt_embedding = sentence_model.encode(
-            [prompt], 
-            convert_to_numpy=True, 
-            normalize_embeddings=True
-        )[0]
+        # Generate prompt embedding as part of a micro-batch
+        prompt_embedding = await embedding_batcher.submit(prompt)
         
-        # Calculate similarities
-        similarities = category_embeddings @ prompt_embedding
+        # Calculate similarities as int8 dot products accumulated in int32.
+        # Reference rows carry different scales, so they are reapplied before
+        # argmax; the prompt scale is shared and only rescales the confidence.
+        prompt_int8, prompt_scale = quantize_int8(prompt_embedding)
+        dots, similarities = get_similarity_buffers(category_int8.shape[0])
+        np.einsum('ij,j->i', category_int8, prompt_int8[0], dtype=np.int32, out=dots)
+        np.multiply(dots, category_scales, out=similarities)
         
         # Find best match
         best_idx = np.argmax(similarities)
         best_category = category_labels[best_idx]
-        confidence = float(similarities[best_idx])
+        # int8 rounding can push an exact match slightly past 1.0
+        confidence = min(1.0, float(similarities[best_idx] * prompt_scale[0]))
         
         return best_category, confidence
         
@@ -223,14 +658,18 @@ def classify_with_ml(prompt: str) -> tuple:
         logger.error(f"ML classification failed: {e}")
         return None, 0.0
 
-def hybrid_classify(prompt: str) -> tuple:
+async def hybrid_classify(prompt: str, prompt_lower: str, keyword_hits: List[int]) -> tuple:
     """Hybrid classification combining rules and ML"""
     
     # Get rule-based result
-    rule_category, rule_confidence = classify_with_rules(prompt)
+    rule_category, rule_confidence, top2_ratio = classify_with_rules(prompt_lower, keyword_hits)
+    
+    # Unambiguous keyword signal - don't pay for a transformer forward
+    if top2_ratio > RULE_SHORTCUT_RATIO and rule_confidence > RULE_SHORTCUT_CONFIDENCE:
+        return rule_category, rule_confidence, "rule-based", None
     
     # Get ML result if available
-    ml_category, ml_confidence = classify_with_ml(prompt)
+    ml_category, ml_confidence = await classify_with_ml(prompt)
     
     if ml_category is None:
         # ML not available, use rule-based only
@@ -254,63 +693,89 @@ def hybrid_classify(prompt: str) -> tuple:
         else:
             return rule_category, rule_confidence, "rule-based", ml_confidence
 
-def calculate_other_metrics(prompt: str, category: str) -> dict:
-    """Calculate complexity, creativity, and other metrics"""
-    token_count = estimate_tokens(prompt)
-    
+# Metric lookups shared by the scoring kernel
+CATEGORY_CREATIVITY = {"creative_writing": 0.9, "chat": 0.6, "general": 0.4}
+INTERACTION_STYLES = ("conversational", "formal", "direct")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+@njit(cache=True)
+def score_metrics(token_count, tech_hits, creative_hits, base_creativity, prompt_len, chat_hit):
+    """Numeric part of calculate_other_metrics, compiled to native code"""
     # Complexity based on length and technical terms
     base_complexity = min(token_count / 100.0, 0.5)
-    tech_terms = ['algorithm', 'optimization', 'implementation', 'architecture', 'methodology']
-    tech_bonus = sum(0.1 for term in tech_terms if term in prompt.lower())
-    complexity = min(base_complexity + tech_bonus, 1.0)
+    complexity = min(base_complexity + 0.1 * tech_hits, 1.0)
     
     # Creativity based on category and creative indicators
-    creative_categories = {"creative_writing": 0.9, "chat": 0.6, "general": 0.4}
-    base_creativity = creative_categories.get(category, 0.3)
-    creative_words = ['imagine', 'creative', 'story', 'unique', 'original']
-    creative_bonus = sum(0.1 for word in creative_words if word in prompt.lower())
-    creativity = min(base_creativity + creative_bonus, 1.0)
-    
-    # Other metrics
-    urgency = 0.2  # Default low urgency
+    creativity = min(base_creativity + 0.1 * creative_hits, 1.0)
+    
     output_length = min(token_count * 2, 1000)
     
-    # Interaction style
-    if any(word in prompt.lower() for word in ['hey', 'hi', 'chat', 'talk']):
-        interaction_style = "conversational"
-    elif len(prompt) > 100:
-        interaction_style = "formal"
+    # Interaction style index into INTERACTION_STYLES
+    if chat_hit:
+        style_idx = 0
+    elif prompt_len > 100:
+        style_idx = 1
     else:
-        interaction_style = "direct"
+        style_idx = 2
     
-    # Difficulty
+    # Difficulty index into DIFFICULTIES
     if complexity > 0.7:
-        difficulty = "hard"
+        difficulty_idx = 2
     elif complexity > 0.4:
-        difficulty = "medium"
+        difficulty_idx = 1
     else:
-        difficulty = "easy"
+        difficulty_idx = 0
+    
+    return complexity, creativity, output_length, style_idx, difficulty_idx
+
+def calculate_other_metrics(prompt: str, keyword_hits: List[int], category: str) -> dict:
+    """Calculate complexity, creativity, and other metrics"""
+    token_count = estimate_tokens(prompt)
+    
+    complexity, creativity, output_length, style_idx, difficulty_idx = score_metrics(
+        token_count,
+        keyword_hits[TECH_IDX],
+        keyword_hits[CREATIVE_IDX],
+        CATEGORY_CREATIVITY.get(category, 0.3),
+        len(prompt),
+        keyword_hits[CHAT_OPEN_IDX] > 0
+    )
     
     return {
         "complexity_score": complexity,
         "creativity_score": creativity,
         "token_count_estimate": token_count,
-        "urgency_level": urgency,
+        "urgency_level": 0.2,  # Default low urgency
         "output_length_estimate": output_length,
-        "interaction_style": interaction_style,
-        "difficulty": difficulty
+        "interaction_style": INTERACTION_STYLES[style_idx],
+        "difficulty": DIFFICULTIES[difficulty_idx]
     }
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the service"""
+    global embed_pool
+    
     logger.info("🚀 Starting Hybrid Classifier Service")
+    
+    # Compile the metrics kernel before the first request
+    score_metrics(1, 0, 0, 0.3, 1, False)
+    
     ml_available = initialize_ml_model()
     if ml_available:
+        # Dedicated pool so encodes don't contend with Starlette's default threadpool
+        embed_pool = ThreadPoolExecutor(max_workers=embed_pool_size(), thread_name_prefix="embed")
+        embedding_batcher.start(embed_pool)
         logger.info("✅ Hybrid mode: Rule-based + ML classification")
     else:
         logger.info("📋 Fallback mode: Rule-based classification only")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the encode pool"""
+    if embed_pool is not None:
+        embed_pool.shutdown(wait=False)
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -321,27 +786,40 @@ async def health_check():
         "ml_available": sentence_model is not None
     }
 
-@app.post("/classify", response_model=HybridResponse)
-async def classify_text(request: ClassificationRequest):
+@app.post("/classify")
+async def classify_text(http_request: Request):
     """Main hybrid classification endpoint"""
+    try:
+        request = request_decoder.decode(await http_request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    
     try:
         prompt = request.prompt.strip()
         if not prompt:
             raise HTTPException(status_code=400, detail="Empty prompt")
         
-        # Perform hybrid classification
-        category, confidence, method, ml_conf = hybrid_classify(prompt)
+        prompt_lower = prompt.lower()
+        keyword_hits = scan_keywords(prompt_lower)
         
-        # Calculate other metrics
-        metrics = calculate_other_metrics(prompt, category)
+        # Perform hybrid classification, reusing the result for repeated prompts
+        with classification_cache_lock:
+            result = classification_cache.get(prompt)
+        if result is None:
+            result = await hybrid_classify(prompt, prompt_lower, keyword_hits)
+            with classification_cache_lock:
+                classification_cache[prompt] = result
+        category, confidence, method, ml_conf = result
         
-        return HybridResponse(
-            primary_use_case=category,
-            domain_confidence=confidence,
-            classification_method=method,
-            ml_confidence=ml_conf,
-            **metrics
-        )
+        # Calculate other metrics and fill in the classification fields
+        response = calculate_other_metrics(prompt, keyword_hits, category)
+        response["primary_use_case"] = category
+        response["domain_confidence"] = confidence
+        response["classification_method"] = method
+        response["ml_confidence"] = ml_conf
+        return ORJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Classification error: {e}")
@@ -354,7 +832,8 @@ async def get_info():
         "service": "Hybrid LLM Router Classifier",
         "version": "2.0.0",
         "ml_model_available": sentence_model is not None,
-        "ml_model": "all-MiniLM-L6-v2" if sentence_model else None,
+        "ml_model": MODEL_NAME if sentence_model else None,
+        "ml_backend": ML_BACKEND if sentence_model else None,
         "categories": list(REFERENCE_CATEGORIES.keys()),
         "classification_methods": ["rule-based", "ml-based", "hybrid"]
     }
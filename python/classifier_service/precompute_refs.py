@@ -0,0 +1,34 @@
+"""
+Precompute reference category embeddings at build time
+Writes the files hybrid_app memory-maps on startup instead of re-encoding
+"""
+
+import json
+import sys
+
+import numpy as np
+
+import hybrid_app
+
+def main() -> int:
+    if not hybrid_app.initialize_ml_model(use_precomputed=False):
+        print("ML model unavailable, reference embeddings not written")
+        return 1
+    
+    all_examples, labels = hybrid_app.reference_examples()
+    embeddings = np.ascontiguousarray(hybrid_app.category_embeddings, dtype=np.float32)
+    np.save(hybrid_app.CATEGORY_EMBEDDINGS_PATH, embeddings)
+    
+    with open(hybrid_app.CATEGORY_LABELS_PATH, 'w') as f:
+        json.dump({
+            "model": hybrid_app.MODEL_NAME,
+            "backend": hybrid_app.ML_BACKEND,
+            "examples": all_examples,
+            "labels": labels
+        }, f, indent=2)
+    
+    print(f"Wrote {embeddings.shape} reference embeddings to {hybrid_app.CATEGORY_EMBEDDINGS_PATH}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,26 @@ Combines static, scraped, and real-time data for intelligent model quantificatio
 """
 
 import asyncio
-import json
+import orjson
 import os
-import glob
+import re
+import fnmatch
+import functools
 import logging
-import redis
+import multiprocessing
+import time
+from redis import asyncio as aioredis
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from numba import njit
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 import aiohttp
 import yaml
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 # Configure logging
@@ -27,25 +34,47 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Enhanced LLM Router Ingestor",
     description="Multi-layer intelligent data consolidation service",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Data Models
+# Explicit __slots__ (dataclass(slots=True) needs Python 3.10); to_dict is a
+# shallow conversion, unlike asdict's recursive deep copy
 @dataclass
 class CategoryScore:
+    __slots__ = ('score', 'confidence', 'contributing_scores', 'last_updated')
     score: float
     confidence: float
     contributing_scores: Dict[str, Dict[str, Any]]
     last_updated: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'score': self.score,
+            'confidence': self.confidence,
+            'contributing_scores': self.contributing_scores,
+            'last_updated': self.last_updated
+        }
 
 @dataclass
 class DataProvenance:
+    __slots__ = ('source', 'last_updated', 'data_quality')
     source: str
     last_updated: str
     data_quality: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'last_updated': self.last_updated,
+            'data_quality': self.data_quality
+        }
 
 @dataclass
 class EnhancedModel:
+    __slots__ = ('model_id', 'provider', 'display_name', 'static_data', 'category_scores',
+                 'data_provenance', 'performance_metadata', 'last_consolidated', 'overall_quality')
     model_id: str
     provider: str
     display_name: str
@@ -55,6 +84,22 @@ class EnhancedModel:
     performance_metadata: Dict[str, Any]
     last_consolidated: str
     overall_quality: float
+    
+    def to_dict(self, data_provenance: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        # Callers serializing a whole run pass its provenance converted once
+        if data_provenance is None:
+            data_provenance = {k: v.to_dict() for k, v in self.data_provenance.items()}
+        return {
+            'model_id': self.model_id,
+            'provider': self.provider,
+            'display_name': self.display_name,
+            'static_data': self.static_data,
+            'category_scores': self.category_scores,
+            'data_provenance': data_provenance,
+            'performance_metadata': self.performance_metadata,
+            'last_consolidated': self.last_consolidated,
+            'overall_quality': self.overall_quality
+        }
 
 # Configuration
 class Config:
@@ -83,7 +128,8 @@ class Config:
 
 # Global instances
 config = Config()
-redis_client = None
+redis_client: Optional[aioredis.Redis] = None
+redis_pool: Optional[aioredis.ConnectionPool] = None
 
 # Classification Categories Configuration
 CLASSIFICATION_CATEGORIES = {
@@ -151,17 +197,77 @@ CLASSIFICATION_CATEGORIES = {
     }
 }
 
+# Inverted index: benchmark -> [(category, weight)], in first-seen benchmark order
+BENCH_TO_CATS: Dict[str, List[Tuple[str, float]]] = {}
+for _category, _category_config in CLASSIFICATION_CATEGORIES.items():
+    for _benchmark, _weight in _category_config['benchmark_weights'].items():
+        BENCH_TO_CATS.setdefault(_benchmark, []).append((_category, _weight))
+
+# Parsing patterns, compiled once at import
+_COST_RE = re.compile(r'\$(\d+\.?\d*)/(\d+[KM]?)\s*(\w+\s*)?tokens?', re.IGNORECASE)  # "$1.25/1M" or "$0.03/1K"
+_BENCH_RE = re.compile(r'([A-Za-z0-9\s\-\']+):\s*(\d+\.?\d*)%?')  # "GPQA Diamond: 89.4%"
+_NORM_RE = re.compile(r'[^a-z0-9]')
+
+# Recency decay: factor by score age, stepping down at 30, 90 and 180 days
+DECAY_STEPS_DAYS = np.array([30, 90, 180])
+DECAY_FACTORS = np.array([1.0, 0.9, 0.8, 0.7])
+UNKNOWN_DATE_FACTOR = 0.8
+
+@functools.lru_cache(maxsize=4096)
+def _parse_score_ts(score_date: str) -> float:
+    """Unix timestamp of an ISO score date, NaN when unparseable"""
+    try:
+        date_obj = datetime.fromisoformat(score_date.replace('Z', '+00:00'))
+        return date_obj.replace(tzinfo=None).timestamp()
+    except Exception:
+        return np.nan
+
+def _static_float(static_data: Dict[str, Any], key: str, default: float) -> float:
+    """Numeric static field, falling back to the default when it is missing or null"""
+    value = static_data.get(key)
+    return default if value is None else float(value)
+
+def _read_json(path: str) -> Any:
+    """Blocking JSON file read, run via asyncio.to_thread"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _write_json(path: str, data: Any) -> None:
+    """Blocking indented JSON file write, run via asyncio.to_thread"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+def _scan_mtimes(directory: str, file_pattern: str) -> Dict[str, float]:
+    """Blocking directory scan returning each matching file's mtime, run via asyncio.to_thread"""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.path: entry.stat().st_mtime
+                for entry in entries
+                if fnmatch.fnmatch(entry.name, file_pattern) and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
 class DataSourceManager:
     """Base class for data source management"""
     
     def __init__(self, source_name: str):
         self.source_name = source_name
-        self.last_update = None
+        self.last_update: Optional[datetime] = None
+        self.last_update_iso: Optional[str] = None
         self.data_quality = 0.0
+        # Dotted field names split once instead of on every completeness check
+        self._required_paths = [tuple(field.split('.')) for field in self._get_required_fields()]
     
     async def fetch_data(self) -> Dict[str, Any]:
         raise NotImplementedError
     
+    def _mark_updated(self, when: Optional[datetime] = None):
+        """Record a successful fetch, keeping its ISO form for status and provenance"""
+        self.last_update = when or datetime.now()
+        self.last_update_iso = self.last_update.isoformat()
+    
     def calculate_quality(self, data: Dict[str, Any]) -> float:
         """Calculate data quality score based on completeness and freshness"""
         if not data:
@@ -175,15 +281,15 @@ class DataSourceManager:
     
     def _calculate_completeness(self, data: Dict[str, Any]) -> float:
         """Calculate data completeness score"""
-        required_fields = self._get_required_fields()
-        present_fields = 0
-        
-        for model_id, model_data in data.items():
-            for field in required_fields:
-                if self._has_field(model_data, field):
-                    present_fields += 1
+        required_paths = self._required_paths
+        present_fields = sum(
+            1
+            for model_data in data.values()
+            for path in required_paths
+            if self._has_field(model_data, path)
+        )
         
-        total_expected = len(data) * len(required_fields)
+        total_expected = len(data) * len(required_paths)
         return present_fields / total_expected if total_expected > 0 else 0.0
     
     def _calculate_freshness(self) -> float:
@@ -202,38 +308,38 @@ class DataSourceManager:
     def _calculate_consistency(self, data: Dict[str, Any]) -> float:
         """Calculate data consistency score"""
         # Simple heuristic: check for reasonable score ranges
-        scores = []
-        for model_data in data.values():
-            if isinstance(model_data, dict):
-                for key, value in model_data.items():
-                    if isinstance(value, (int, float)) and 0 <= value <= 100:
-                        scores.append(value)
+        scores = np.fromiter(
+            (value
+             for model_data in data.values() if isinstance(model_data, dict)
+             for value in model_data.values()
+             if isinstance(value, (int, float)) and 0 <= value <= 100),
+            dtype=np.float64
+        )
         
-        if not scores:
+        if not scores.size:
             return 0.5  # Neutral if no numeric scores found
         
         # Check if scores fall within reasonable ranges
-        mean_score = np.mean(scores)
-        std_score = np.std(scores)
+        std_score = scores.std()
         
         # Good consistency if standard deviation is reasonable
-        return max(0.0, min(1.0, 1.0 - (std_score / 50.0)))
+        return float(max(0.0, min(1.0, 1.0 - (std_score / 50.0))))
     
     def _get_required_fields(self) -> List[str]:
         return []
     
-    def _has_field(self, data: Dict[str, Any], field: str) -> bool:
-        """Check if field exists in nested data structure"""
-        if '.' in field:
-            keys = field.split('.')
-            current = data
-            for key in keys:
-                if isinstance(current, dict) and key in current:
-                    current = current[key]
-                else:
-                    return False
-            return current is not None
-        return field in data
+    @staticmethod
+    def _has_field(data: Dict[str, Any], path: Tuple[str, ...]) -> bool:
+        """Check if a pre-split field path exists in nested data structure"""
+        if len(path) == 1:
+            return path[0] in data
+        current = data
+        for key in path:
+            if isinstance(current, dict) and key in current:
+                current = current[key]
+            else:
+                return False
+        return current is not None
 
 class StaticDataManager(DataSourceManager):
     """Manages static model data from models.json"""
@@ -247,8 +353,7 @@ class StaticDataManager(DataSourceManager):
     async def fetch_data(self) -> Dict[str, Any]:
         """Load static model data"""
         try:
-            with open(self.file_path, 'r') as f:
-                models_list = json.load(f)
+            models_list = await asyncio.to_thread(_read_json, self.file_path)
             
             # Convert list to dict keyed by model ID
             data = {}
@@ -256,7 +361,7 @@ class StaticDataManager(DataSourceManager):
                 if 'id' in model:
                     data[model['id']] = model
             
-            self.last_update = datetime.now()
+            self._mark_updated()
             self.data_quality = self.calculate_quality(data)
             
             logger.info(f"Loaded {len(data)} models from static data")
@@ -278,117 +383,170 @@ class BenchmarkDataManager(DataSourceManager):
         self.data_dir = os.getenv('SCRAPED_DATA_DIR',
                                  config.get('data_sources.scraped.directory', 'configs'))
         self.file_pattern = config.get('data_sources.scraped.pattern', 'trun*.json')
+        # Parsed models per file, keyed by path and tagged with the file's mtime
+        self._file_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.max_concurrent_reads = 16
     
     async def fetch_data(self) -> Dict[str, Any]:
         """Load benchmark data from multiple trun*.json files with proper parsing"""
         try:
             data = {}
-            pattern = os.path.join(self.data_dir, self.file_pattern)
             
-            for file_path in glob.glob(pattern):
-                with open(file_path, 'r') as f:
-                    file_data = json.load(f)
-                    
-                    # Parse the structured trun*.json format
-                    if 'output' in file_data:
-                        output = file_data['output']
-                        
-                        # Extract models from different provider profiles
-                        provider_keys = [
-                            'openai_models_profile', 'anthropic_models_profile', 
-                            'google_models_profile', 'meta_nvidia_models_profile',
-                            'mistral_ai_models_profile', 'xai_models_profile',
-                            'other_notable_models_profile'
-                        ]
-                        
-                        # Also check for alternative naming patterns
-                        alt_keys = [
-                            'openai_models', 'anthropic_models', 'google_models',
-                            'meta_models', 'mistral_models', 'xai_models'
-                        ]
-                        
-                        all_keys = provider_keys + alt_keys
-                        
-                        for key in all_keys:
-                            if key in output and isinstance(output[key], list):
-                                for model_info in output[key]:
-                                    if isinstance(model_info, dict):
-                                        # Extract model identifier
-                                        model_id = None
-                                        
-                                        # Try different ID field names
-                                        id_fields = ['model_name', 'api_alias', 'id', 'name']
-                                        for id_field in id_fields:
-                                            if id_field in model_info:
-                                                model_id = model_info[id_field]
-                                                if isinstance(model_id, str):
-                                                    # For api_alias, take first alias if comma-separated
-                                                    if ',' in model_id:
-                                                        model_id = model_id.split(',')[0].strip()
-                                                    break
-                                        
-                                        if model_id:
-                                            # Structure the model data with rich benchmark info
-                                            structured_data = {
-                                                'source': 'benchmark',
-                                                'provider': key.replace('_models_profile', '').replace('_models', ''),
-                                                'last_updated': datetime.now().isoformat()
-                                            }
-                                            
-                                            # Map key fields
-                                            field_mapping = {
-                                                'model_name': 'display_name',
-                                                'api_alias': 'api_name',
-                                                'context_window_tokens': 'context_window',
-                                                'pricing_details': 'pricing',
-                                                'benchmark_highlights': 'benchmarks',
-                                                'benchmark_scores': 'benchmarks',
-                                                'best_use_cases': 'use_cases',
-                                                'capabilities_and_modalities': 'capabilities',
-                                                'modalities': 'modalities',
-                                                'availability_status': 'status'
-                                            }
-                                            
-                                            for orig_key, new_key in field_mapping.items():
-                                                if orig_key in model_info:
-                                                    structured_data[new_key] = model_info[orig_key]
-                                            
-                                            # Parse pricing if it's a string
-                                            if 'pricing' in structured_data and isinstance(structured_data['pricing'], str):
-                                                pricing_text = structured_data['pricing']
-                                                structured_data['pricing_parsed'] = self._parse_pricing(pricing_text)
-                                            
-                                            # Parse benchmarks if it's a string  
-                                            if 'benchmarks' in structured_data and isinstance(structured_data['benchmarks'], str):
-                                                benchmark_text = structured_data['benchmarks']
-                                                structured_data['benchmarks_parsed'] = self._parse_benchmarks(benchmark_text)
-                                            
-                                            data[model_id] = structured_data
-                    
-                    # Fallback for simple JSON structure
-                    else:
-                        data.update(file_data)
+            # Directory scans block too; scan once per pass, off the event loop
+            mtimes = await asyncio.to_thread(_scan_mtimes, self.data_dir, self.file_pattern)
+            
+            # Files unchanged since the last pass reuse their parsed models
+            changed_paths = [
+                file_path for file_path, mtime in mtimes.items()
+                if self._file_cache.get(file_path, (None,))[0] != mtime
+            ]
+            
+            # Read changed files concurrently, bounded to cap open file descriptors
+            semaphore = asyncio.Semaphore(self.max_concurrent_reads)
+            
+            async def read_file(file_path: str) -> Any:
+                async with semaphore:
+                    return await asyncio.to_thread(_read_json, file_path)
+            
+            file_contents = await asyncio.gather(*(read_file(path) for path in changed_paths))
+            for file_path, file_data in zip(changed_paths, file_contents):
+                self._file_cache[file_path] = (mtimes[file_path], self._parse_file(file_data))
+            
+            # Merge in scan order so later files still override earlier ones
+            for file_path in mtimes:
+                data.update(self._file_cache[file_path][1])
+            
+            # Forget files that no longer match the pattern
+            for stale_path in self._file_cache.keys() - mtimes.keys():
+                del self._file_cache[stale_path]
             
-            self.last_update = datetime.now()
+            self._mark_updated()
             self.data_quality = self.calculate_quality(data)
             
-            logger.info(f"Loaded benchmark data for {len(data)} models from {len(glob.glob(pattern))} files")
+            logger.info(f"Loaded benchmark data for {len(data)} models from {len(mtimes)} files")
             return data
             
         except Exception as e:
             logger.error(f"Failed to load benchmark data: {e}")
             return {}
     
+    def _parse_file(self, file_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract per-model benchmark data from one parsed trun*.json file"""
+        data = {}
+        parsed_at = datetime.now().isoformat()
+        
+        # Parse the structured trun*.json format
+        if 'output' in file_data:
+            output = file_data['output']
+            
+            # Extract models from different provider profiles
+            provider_keys = [
+                'openai_models_profile', 'anthropic_models_profile', 
+                'google_models_profile', 'meta_nvidia_models_profile',
+                'mistral_ai_models_profile', 'xai_models_profile',
+                'other_notable_models_profile'
+            ]
+            
+            # Also check for alternative naming patterns
+            alt_keys = [
+                'openai_models', 'anthropic_models', 'google_models',
+                'meta_models', 'mistral_models', 'xai_models'
+            ]
+            
+            all_keys = provider_keys + alt_keys
+            
+            for key in all_keys:
+                if key in output and isinstance(output[key], list):
+                    for model_info in output[key]:
+                        if isinstance(model_info, dict):
+                            # Extract model identifier
+                            model_id = None
+                            
+                            # Try different ID field names
+                            id_fields = ['model_name', 'api_alias', 'id', 'name']
+                            for id_field in id_fields:
+                                if id_field in model_info:
+                                    model_id = model_info[id_field]
+                                    if isinstance(model_id, str):
+                                        # For api_alias, take first alias if comma-separated
+                                        if ',' in model_id:
+                                            model_id = model_id.split(',')[0].strip()
+                                        break
+                            
+                            if model_id:
+                                # Structure the model data with rich benchmark info
+                                structured_data = {
+                                    'source': 'benchmark',
+                                    'provider': key.replace('_models_profile', '').replace('_models', ''),
+                                    'last_updated': parsed_at
+                                }
+                                
+                                # Map key fields
+                                field_mapping = {
+                                    'model_name': 'display_name',
+                                    'api_alias': 'api_name',
+                                    'context_window_tokens': 'context_window',
+                                    'pricing_details': 'pricing',
+                                    'benchmark_highlights': 'benchmarks',
+                                    'benchmark_scores': 'benchmarks',
+                                    'best_use_cases': 'use_cases',
+                                    'capabilities_and_modalities': 'capabilities',
+                                    'modalities': 'modalities',
+                                    'availability_status': 'status'
+                                }
+                                
+                                for orig_key, new_key in field_mapping.items():
+                                    if orig_key in model_info:
+                                        structured_data[new_key] = model_info[orig_key]
+                                
+                                # Parse pricing if it's a string
+                                if 'pricing' in structured_data and isinstance(structured_data['pricing'], str):
+                                    pricing_text = structured_data['pricing']
+                                    structured_data['pricing_parsed'] = self._parse_pricing(pricing_text)
+                                
+                                # Parse benchmarks if it's a string  
+                                if 'benchmarks' in structured_data and isinstance(structured_data['benchmarks'], str):
+                                    benchmark_text = structured_data['benchmarks']
+                                    structured_data['benchmarks_parsed'] = self._parse_benchmarks(benchmark_text)
+                                
+                                data[model_id] = structured_data
+        
+        # Fallback for simple JSON structure
+        else:
+            data.update(file_data)
+        
+        for model_data in data.values():
+            if isinstance(model_data, dict):
+                self._index_scores(model_data)
+        
+        return data
+    
+    @staticmethod
+    def _index_scores(model_data: Dict[str, Any]) -> None:
+        """Split scored benchmark entries into flat score and date maps, once per parsed file"""
+        bench_scores = model_data.get('benchmarks')
+        if not isinstance(bench_scores, dict):
+            return  # Free-text benchmarks keep the generic path in ModelMatcher.flatten_scores
+        
+        scores = {}
+        dates = {}  # Dict entries keep their own date, even None; bare scores inherit the analytics date
+        for benchmark, score_info in bench_scores.items():
+            if benchmark not in BENCH_TO_CATS:
+                continue
+            if isinstance(score_info, dict):
+                scores[benchmark] = score_info.get('score')
+                dates[benchmark] = score_info.get('date')
+            else:
+                scores[benchmark] = score_info
+        model_data['_flat_scores'] = scores
+        model_data['_flat_dates'] = dates
+    
     def _parse_pricing(self, pricing_text: str) -> Dict[str, Any]:
         """Parse pricing information from text"""
         try:
             pricing = {}
-            # Extract costs using regex
-            import re
-            
-            # Look for patterns like "$1.25/1M" or "$0.03/1K"
-            cost_pattern = r'\$(\d+\.?\d*)/(\d+[KM]?)\s*(\w+\s*)?tokens?'
-            matches = re.findall(cost_pattern, pricing_text, re.IGNORECASE)
+            # Extract costs like "$1.25/1M" or "$0.03/1K"
+            matches = _COST_RE.findall(pricing_text)
             
             for match in matches:
                 cost, unit, token_type = match
@@ -413,11 +571,8 @@ class BenchmarkDataManager(DataSourceManager):
         """Parse benchmark scores from text"""
         try:
             benchmarks = {}
-            import re
-            
             # Look for patterns like "GPQA Diamond: 89.4%" or "SWE Bench: 74.9%"
-            benchmark_pattern = r'([A-Za-z0-9\s\-\']+):\s*(\d+\.?\d*)%?'
-            matches = re.findall(benchmark_pattern, benchmark_text)
+            matches = _BENCH_RE.findall(benchmark_text)
             
             for match in matches:
                 benchmark_name, score = match
@@ -447,6 +602,29 @@ class AnalyticsAPIManager(DataSourceManager):
         self.api_url = 'https://artificialanalysis.ai/api/v2/data/llms/models'
         self.api_key = os.getenv('ANALYTICS_API_KEY')
         self.timeout = 30
+        self.cache_key = f"analytics:{self.api_url}"
+        self.cache_ttl = config.get('data_sources.api.cache_ttl', 300)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create one keep-alive session for the service lifetime"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def fetch_data(self) -> Dict[str, Any]:
         """Fetch real-time data from Analytics AI API"""
@@ -454,45 +632,76 @@ class AnalyticsAPIManager(DataSourceManager):
             logger.warning("Analytics API key not found, skipping real-time data")
             return {}
         
+        # Serve a recent response from Redis without calling the API
+        cached = await self._get_cached()
+        if cached is not None:
+            if self.last_update is None:
+                self._mark_updated()
+            self.data_quality = self.calculate_quality(cached)
+            logger.info(f"Using cached real-time data for {len(cached)} models")
+            return cached
+        
         try:
             headers = {'x-api-key': self.api_key}
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            session = await self._get_session()
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.api_url, headers=headers) as response:
-                    if response.status == 200:
-                        api_data = await response.json()
-                        
-                        # Transform API data to our format
-                        data = {}
-                        for model in api_data.get('data', []):
-                            model_name = self._normalize_model_name(model.get('name', ''))
-                            data[model_name] = {
-                                'evaluations': model.get('evaluations', {}),
-                                'pricing': model.get('pricing', {}),
-                                'performance': {
-                                    'tokens_per_second': model.get('median_output_tokens_per_second', 0),
-                                    'time_to_first_token': model.get('median_time_to_first_token_seconds', 0)
-                                },
-                                'metadata': {
-                                    'source': 'analytics_ai',
-                                    'last_updated': datetime.now().isoformat()
-                                }
+            async with session.get(self.api_url, headers=headers) as response:
+                if response.status == 200:
+                    api_data = orjson.loads(await response.read())
+                    
+                    # Transform API data to our format, stamped with one fetch time
+                    fetched_at = datetime.now()
+                    fetched_iso = fetched_at.isoformat()
+                    data = {}
+                    for model in api_data.get('data', []):
+                        model_name = self._normalize_model_name(model.get('name', ''))
+                        data[model_name] = {
+                            'evaluations': model.get('evaluations', {}),
+                            'pricing': model.get('pricing', {}),
+                            'performance': {
+                                'tokens_per_second': model.get('median_output_tokens_per_second', 0),
+                                'time_to_first_token': model.get('median_time_to_first_token_seconds', 0)
+                            },
+                            'metadata': {
+                                'source': 'analytics_ai',
+                                'last_updated': fetched_iso
                             }
-                        
-                        self.last_update = datetime.now()
-                        self.data_quality = self.calculate_quality(data)
-                        
-                        logger.info(f"Fetched real-time data for {len(data)} models")
-                        return data
-                    else:
-                        logger.error(f"Analytics API returned status {response.status}")
-                        return {}
-                        
+                        }
+                    
+                    self._mark_updated(fetched_at)
+                    self.data_quality = self.calculate_quality(data)
+                    await self._set_cached(data)
+                    
+                    logger.info(f"Fetched real-time data for {len(data)} models")
+                    return data
+                else:
+                    logger.error(f"Analytics API returned status {response.status}")
+                    return {}
+                    
         except Exception as e:
             logger.error(f"Failed to fetch Analytics AI data: {e}")
             return {}
     
+    async def _get_cached(self) -> Optional[Dict[str, Any]]:
+        """Read the last API response from Redis, if still cached"""
+        if not redis_client:
+            return None
+        try:
+            cached = await redis_client.get(self.cache_key)
+            return orjson.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning(f"Failed to read cached analytics data: {e}")
+            return None
+    
+    async def _set_cached(self, data: Dict[str, Any]):
+        """Cache the transformed API response in Redis for cache_ttl seconds"""
+        if not redis_client:
+            return
+        try:
+            await redis_client.setex(self.cache_key, self.cache_ttl, orjson.dumps(data))
+        except Exception as e:
+            logger.warning(f"Failed to cache analytics data: {e}")
+    
     def _normalize_model_name(self, name: str) -> str:
         """Normalize model name for matching"""
         name = name.lower()
@@ -500,9 +709,7 @@ class AnalyticsAPIManager(DataSourceManager):
         for prefix in ['openai/', 'anthropic/', 'google/', 'meta/']:
             name = name.replace(prefix, '')
         # Remove special characters
-        import re
-        name = re.sub(r'[^a-z0-9]', '', name)
-        return name
+        return _NORM_RE.sub('', name)
     
     def _get_required_fields(self) -> List[str]:
         return ['evaluations']
@@ -519,89 +726,163 @@ class ModelMatcher:
         used_benchmark_keys = set()
         used_analytics_keys = set()
         
+        # Normalize each source key once per pass rather than on every lookup
+        benchmark_index = self._build_index(benchmark_data, str.lower)
+        analytics_index = self._build_index(analytics_data, self._normalize_for_matching)
+        
         # First pass: Start with static data as the foundation
         for model_id, static_model in static_data.items():
-            benchmark_match = self._find_benchmark_match(model_id, static_model, benchmark_data)
-            analytics_match = self._find_analytics_match(model_id, static_model, analytics_data)
+            bench_key, benchmark_match = self._find_benchmark_match(model_id, static_model, benchmark_data, benchmark_index)
+            analytics_key, analytics_match = self._find_analytics_match(model_id, static_model, analytics_data, analytics_index)
             
             matches = {
                 'static': static_model,
                 'benchmarks': benchmark_match,
                 'analytics': analytics_match
             }
+            matches['scores'] = self._safe_flatten(model_id, matches)
             
             matched_models[model_id] = matches
             
             # Track used keys
             if benchmark_match:
-                for bench_key, bench_data in benchmark_data.items():
-                    if bench_data == benchmark_match:
-                        used_benchmark_keys.add(bench_key)
-                        break
+                used_benchmark_keys.add(bench_key)
             
             if analytics_match:
-                for analytics_key, analytics_model in analytics_data.items():
-                    if analytics_model == analytics_match:
-                        used_analytics_keys.add(analytics_key)
-                        break
+                used_analytics_keys.add(analytics_key)
         
         # Second pass: Add standalone benchmark models (like GPT-5) that don't match static data
         for bench_key, bench_data in benchmark_data.items():
             if bench_key not in used_benchmark_keys:
                 # Create a synthetic static entry based on benchmark data
                 synthetic_static = self._create_synthetic_static(bench_data, bench_key)
-                analytics_match = self._find_analytics_match_for_benchmark(bench_key, bench_data, analytics_data)
+                analytics_key, analytics_match = self._find_analytics_match_for_benchmark(bench_key, bench_data, analytics_index)
                 
                 matches = {
                     'static': synthetic_static,
                     'benchmarks': bench_data,
                     'analytics': analytics_match
                 }
+                matches['scores'] = self._safe_flatten(bench_key, matches)
                 
                 matched_models[bench_key] = matches
                 
                 if analytics_match:
-                    for analytics_key, analytics_model in analytics_data.items():
-                        if analytics_model == analytics_match:
-                            used_analytics_keys.add(analytics_key)
-                            break
+                    used_analytics_keys.add(analytics_key)
         
         return matched_models
     
-    def _find_benchmark_match(self, model_id: str, static_model: Dict, benchmark_data: Dict) -> Optional[Dict]:
-        """Find matching benchmark data for a model"""
+    def _safe_flatten(self, model_id: str, matches: Dict) -> Dict[str, Tuple[Any, Optional[str], str]]:
+        """Flatten a model's scores, leaving it unscored if its data is malformed"""
+        try:
+            return self.flatten_scores(matches)
+        except Exception as e:
+            logger.error(f"Failed to process model {model_id}: {e}")
+            return {}
+    
+    @staticmethod
+    def flatten_scores(matches: Dict) -> Dict[str, Tuple[Any, Optional[str], str]]:
+        """Resolve each scored benchmark to a (score, date, source) tuple in one pass"""
+        # Resolve the model's score sources once, not once per benchmark
+        bench_data = matches.get('benchmarks')
+        bench_scores = bench_data['benchmarks'] if bench_data and 'benchmarks' in bench_data else {}
+        analytics = matches.get('analytics')
+        evaluations = analytics['evaluations'] if analytics and 'evaluations' in analytics else {}
+        analytics_date = analytics['metadata'].get('last_updated') if analytics and 'metadata' in analytics else None
+        
+        # Benchmark entries pre-split at ingest need no per-entry type checks
+        indexed_scores = bench_data.get('_flat_scores') if bench_data else None
+        if indexed_scores is not None and isinstance(evaluations, dict):
+            indexed_dates = bench_data.get('_flat_dates', {})
+            flat_scores = {
+                benchmark: (score, indexed_dates.get(benchmark, analytics_date), 'benchmarks')
+                for benchmark, score in indexed_scores.items()
+                if score is not None
+            }
+            # Benchmark data wins over analytics, even when its score is missing
+            for benchmark, score in evaluations.items():
+                if score is not None and benchmark in BENCH_TO_CATS and benchmark not in indexed_scores:
+                    flat_scores[benchmark] = (score, analytics_date, 'analytics')
+            return flat_scores
+        
+        # Free-text benchmark blobs are matched by substring; keep the full scan for those
+        if isinstance(bench_scores, dict) and isinstance(evaluations, dict):
+            candidates = dict.fromkeys(
+                benchmark
+                for container in (bench_scores, evaluations)
+                for benchmark in container
+                if benchmark in BENCH_TO_CATS
+            )
+        else:
+            candidates = BENCH_TO_CATS
+        
+        flat_scores = {}
+        for benchmark in candidates:
+            # Benchmark data wins over analytics; dated entries carry their own date
+            if benchmark in bench_scores:
+                score_info = bench_scores[benchmark]
+                if isinstance(score_info, dict):
+                    score, score_date = score_info.get('score'), score_info.get('date')
+                else:
+                    score, score_date = score_info, analytics_date
+                source = 'benchmarks'
+            elif benchmark in evaluations:
+                score, score_date, source = evaluations[benchmark], analytics_date, 'analytics'
+            else:
+                continue
+            
+            if score is not None:
+                flat_scores[benchmark] = (score, score_date, source)
+        return flat_scores
+    
+    def _build_index(self, source_data: Dict, normalize) -> Dict[str, Tuple[str, Dict]]:
+        """Map normalized keys to (key, data), keeping the first key on collisions"""
+        index = {}
+        for key, data in source_data.items():
+            index.setdefault(normalize(key), (key, data))
+        return index
+    
+    def _find_benchmark_match(self, model_id: str, static_model: Dict, benchmark_data: Dict,
+                              benchmark_index: Dict[str, Tuple[str, Dict]]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Find matching benchmark data for a model, returned with its key"""
         # Try exact ID match first
         if model_id in benchmark_data:
-            return benchmark_data[model_id]
+            return model_id, benchmark_data[model_id]
         
-        # Try display name match
+        # Then an exact display name match
         display_name = static_model.get('display_name', '').lower()
-        for bench_id, bench_data in benchmark_data.items():
-            if bench_id.lower() in display_name or display_name in bench_id.lower():
-                return bench_data
+        if display_name in benchmark_index:
+            return benchmark_index[display_name]
+        
+        # Fall back to substring matching
+        for bench_id, match in benchmark_index.items():
+            if bench_id in display_name or display_name in bench_id:
+                return match
         
-        return None
+        return None, None
     
-    def _find_analytics_match(self, model_id: str, static_model: Dict, analytics_data: Dict) -> Optional[Dict]:
-        """Find matching analytics data for a model"""
+    def _find_analytics_match(self, model_id: str, static_model: Dict, analytics_data: Dict,
+                              analytics_index: Dict[str, Tuple[str, Dict]]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Find matching analytics data for a model, returned with its key"""
+        model_key = model_id.lower()
+        if model_key in analytics_data:
+            return model_key, analytics_data[model_key]
+        
         display_name = static_model.get('display_name', '').lower()
         normalized_display = self._normalize_for_matching(display_name)
+        if normalized_display in analytics_index:
+            return analytics_index[normalized_display]
         
-        # Try various matching strategies
-        for analytics_key, analytics_model in analytics_data.items():
-            if (analytics_key == model_id.lower() or 
-                analytics_key in normalized_display or 
-                normalized_display in analytics_key):
-                return analytics_model
+        # Fall back to substring matching
+        for analytics_key, match in analytics_index.items():
+            if analytics_key in normalized_display or normalized_display in analytics_key:
+                return match
         
-        return None
+        return None, None
     
     def _normalize_for_matching(self, name: str) -> str:
         """Normalize name for matching"""
-        import re
-        name = name.lower()
-        name = re.sub(r'[^a-z0-9]', '', name)
-        return name
+        return _NORM_RE.sub('', name.lower())
     
     def _create_synthetic_static(self, bench_data: Dict, model_key: str) -> Dict:
         """Create synthetic static data from benchmark data"""
@@ -651,213 +932,209 @@ class ModelMatcher:
         
         return synthetic
     
-    def _find_analytics_match_for_benchmark(self, bench_key: str, bench_data: Dict, analytics_data: Dict) -> Optional[Dict]:
-        """Find analytics match for a benchmark model"""
+    def _find_analytics_match_for_benchmark(self, bench_key: str, bench_data: Dict,
+                                            analytics_index: Dict[str, Tuple[str, Dict]]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Find analytics match for a benchmark model, returned with its key"""
         # Normalize benchmark model name for matching
         normalized_bench = self._normalize_for_matching(bench_key)
+        if normalized_bench in analytics_index:
+            return analytics_index[normalized_bench]
         
-        # Try various matching strategies
-        for analytics_key, analytics_model in analytics_data.items():
-            normalized_analytics = self._normalize_for_matching(analytics_key)
-            
-            if (normalized_analytics == normalized_bench or 
-                normalized_analytics in normalized_bench or 
-                normalized_bench in normalized_analytics):
-                return analytics_model
+        # Fall back to substring matching
+        for normalized_analytics, match in analytics_index.items():
+            if normalized_analytics in normalized_bench or normalized_bench in normalized_analytics:
+                return match
         
-        return None
+        return None, None
+
+# Integer ids for the category formulas understood by apply_formula
+FORMULA_IDS = {
+    "weighted_average": 0,
+    "weighted_average_with_context": 1,
+    "interpolated_with_bonuses": 2,
+    "accuracy_with_latency_penalty": 3,
+    "conversational_with_efficiency": 4
+}
+BALANCED_AVERAGE_ID = -1
+
+@njit(cache=True)
+def apply_formula(formula_id, base_score, context_window, cost_per_1k, latency_ms):
+    """Apply category-specific formula to calculate final score, compiled to native code"""
+    if formula_id == 1:
+        # Boost for larger context windows in reasoning tasks
+        context_boost = min(0.1, (context_window - 4096) / 100000)  # Up to 10% boost
+        return min(100.0, base_score + (base_score * context_boost))
+    
+    elif formula_id == 2:
+        # Creative writing benefits from larger context and cost efficiency
+        context_bonus = min(10.0, (context_window - 4000) / 1000)  # Up to 10 points
+        cost_bonus = max(0.0, 5.0 - (cost_per_1k * 500))  # Up to 5 points for cheap models
+        return min(100.0, base_score + context_bonus + cost_bonus)
+    
+    elif formula_id == 3:
+        # Question answering penalized by high latency
+        latency_penalty = max(0.0, (latency_ms - 1000) / 10000 * base_score)  # Up to score% penalty
+        return max(0.0, base_score - latency_penalty)
+    
+    elif formula_id == 4:
+        # Chat benefits from low cost and low latency
+        cost_factor = 1.0 + max(0.0, (0.005 - cost_per_1k) / 0.005 * 0.2)  # Up to 20% boost
+        speed_factor = 1.0 + max(0.0, (2000 - latency_ms) / 2000 * 0.1)  # Up to 10% boost
+        return min(100.0, base_score * cost_factor * speed_factor)
+    
+    else:  # weighted_average, balanced_average and fallback
+        return base_score
 
 class CategoryCalculator:
     """Calculate category scores based on multi-source data"""
     
+    # Quality factor by data source
+    QUALITY_FACTORS = {
+        'static': 1.0,
+        'benchmarks': 0.9,
+        'analytics': 0.95
+    }
+    
+    def __init__(self):
+        # Benchmark x category weight matrix, so a batch is scored with two matmuls
+        self.categories = list(CLASSIFICATION_CATEGORIES)
+        self.benchmarks = list(BENCH_TO_CATS)
+        self.bench_idx = {benchmark: i for i, benchmark in enumerate(self.benchmarks)}
+        category_idx = {category: i for i, category in enumerate(self.categories)}
+        self.weights = np.zeros((len(self.benchmarks), len(self.categories)))
+        for benchmark, category_weights in BENCH_TO_CATS.items():
+            for category, weight in category_weights:
+                self.weights[self.bench_idx[benchmark], category_idx[category]] = weight
+        self.weight_totals = self.weights.sum(axis=0)
+        self.formula_ids = [
+            FORMULA_IDS.get(CLASSIFICATION_CATEGORIES[category]['formula'], BALANCED_AVERAGE_ID)
+            for category in self.categories
+        ]
+    
     def calculate_scores(self, model_data: Dict) -> Dict[str, CategoryScore]:
         """Calculate category scores for a model"""
-        category_scores = {}
-        
-        for category, category_config in CLASSIFICATION_CATEGORIES.items():
-            score_data = self._calculate_category_score(model_data, category, category_config)
-            if score_data:
-                category_scores[category] = score_data
-        
-        return category_scores
+        return self.calculate_all_scores({None: model_data}).get(None, {})
     
-    def _calculate_category_score(self, model_data: Dict, category: str, config: Dict) -> Optional[CategoryScore]:
-        """Calculate score for a specific category"""
-        contributing_scores = {}
-        total_weighted_score = 0.0
-        total_weight = 0.0
+    def calculate_all_scores(self, models: Dict[str, Dict], now_ts: Optional[float] = None) -> Dict[str, Dict[str, CategoryScore]]:
+        """Calculate category scores for a batch of models at once"""
+        model_ids = []
+        contributions = []
+        shape = (len(models), len(self.benchmarks))
+        scores = np.zeros(shape)
+        score_ts = np.full(shape, np.nan)
+        quality = np.zeros(shape)
+        present = np.zeros(shape)
+        
+        # One pass per model over the benchmarks it actually has
+        for model_id, model_data in models.items():
+            try:
+                # Matched models arrive pre-flattened; raw source data is flattened here
+                flat_scores = model_data.get('scores')
+                if flat_scores is None:
+                    flat_scores = ModelMatcher.flatten_scores(model_data)
+                
+                # Build the whole row first so a failing model leaves nothing behind
+                cells = []
+                for benchmark, (score, score_date, source) in flat_scores.items():
+                    ts = np.nan
+                    if score_date and isinstance(score_date, str):
+                        ts = _parse_score_ts(score_date)
+                    cells.append((
+                        self.bench_idx[benchmark],
+                        float(score),
+                        ts,
+                        self.QUALITY_FACTORS.get(source, 0.8)
+                    ))
+            except Exception as e:
+                logger.error(f"Failed to process model {model_id}: {e}")
+                continue
+            
+            row = len(model_ids)
+            for col, score, ts, factor in cells:
+                scores[row, col] = score
+                score_ts[row, col] = ts
+                quality[row, col] = factor
+                present[row, col] = 1.0
+            model_ids.append(model_id)
+            contributions.append(flat_scores)
+        
+        # Apply recency and quality factors to every score at once
+        rows = len(model_ids)
+        if now_ts is None:
+            now_ts = time.time()
+        days_old = np.floor((now_ts - score_ts[:rows]) / 86400)
+        adjusted = scores[:rows] * self._recency_factors(days_old) * quality[:rows]
+        
+        # Weighted score sums and the weight each model covers, per category
+        weighted_sums = adjusted @ self.weights
+        covered_weights = present[:rows] @ self.weights
+        
+        # Weighted average per category, and confidence from the share of weight covered
+        covered = covered_weights > 0
+        base_scores = np.divide(weighted_sums, covered_weights, out=np.zeros_like(weighted_sums), where=covered)
+        confidences = np.minimum(
+            np.divide(covered_weights, self.weight_totals, out=np.zeros_like(covered_weights), where=covered),
+            1.0
+        )
         
-        # Process benchmark scores
-        for benchmark, weight in config['benchmark_weights'].items():
-            score = self._extract_benchmark_score(model_data, benchmark)
-            if score is not None:
-                # Apply recency and quality factors
-                recency_factor = self._calculate_recency_factor(model_data, benchmark)
-                quality_factor = self._get_quality_factor(model_data, benchmark)
+        last_updated = datetime.fromtimestamp(now_ts).isoformat()
+        results = {}
+        for row, model_id in enumerate(model_ids):
+            try:
+                # Formula inputs, read once per model
+                static_data = models[model_id].get('static', {})
+                context_window = _static_float(static_data, 'context_window', 4096)
+                cost_per_1k = _static_float(static_data, 'cost_in_per_1k', 0.01)
+                latency_ms = _static_float(static_data, 'avg_latency_ms', 2000)
                 
-                adjusted_score = score * recency_factor * quality_factor
-                weighted_score = adjusted_score * weight
+                category_scores = {}
+                row_scores = base_scores[row].tolist()
+                row_confidences = confidences[row].tolist()
+                for col in np.flatnonzero(covered[row]).tolist():
+                    category = self.categories[col]
+                    category_config = CLASSIFICATION_CATEGORIES[category]
+                    model_scores = contributions[row]
+                    contributing_scores = {
+                        benchmark: {
+                            'score': model_scores[benchmark][0],
+                            'weight': weight,
+                            'source': model_scores[benchmark][2],
+                            'date': model_scores[benchmark][1],
+                            'adjusted_score': float(adjusted[row, self.bench_idx[benchmark]])
+                        }
+                        for benchmark, weight in category_config['benchmark_weights'].items()
+                        if benchmark in model_scores
+                    }
                 
-                total_weighted_score += weighted_score
-                total_weight += weight
+                    # Calculate final score based on formula
+                    final_score = apply_formula(
+                        self.formula_ids[col],
+                        row_scores[col],
+                        context_window,
+                        cost_per_1k,
+                        latency_ms
+                    )
                 
-                contributing_scores[benchmark] = {
-                    'score': score,
-                    'weight': weight,
-                    'source': self._get_score_source(model_data, benchmark),
-                    'date': self._get_score_date(model_data, benchmark),
-                    'adjusted_score': adjusted_score
-                }
-        
-        if total_weight == 0:
-            return None
-        
-        # Calculate final score based on formula
-        final_score = self._apply_formula(
-            total_weighted_score / total_weight,
-            model_data,
-            category,
-            config['formula']
-        )
-        
-        # Calculate confidence based on data availability
-        confidence = min(total_weight / sum(config['benchmark_weights'].values()), 1.0)
-        
-        return CategoryScore(
-            score=final_score,
-            confidence=confidence,
-            contributing_scores=contributing_scores,
-            last_updated=datetime.now().isoformat()
-        )
-    
-    def _extract_benchmark_score(self, model_data: Dict, benchmark: str) -> Optional[float]:
-        """Extract score for a specific benchmark from model data"""
-        # Try benchmarks data first
-        if 'benchmarks' in model_data and model_data['benchmarks']:
-            bench_data = model_data['benchmarks']
-            if 'benchmarks' in bench_data and benchmark in bench_data['benchmarks']:
-                score_info = bench_data['benchmarks'][benchmark]
-                if isinstance(score_info, dict):
-                    return score_info.get('score')
-                return score_info
-        
-        # Try analytics data
-        if 'analytics' in model_data and model_data['analytics']:
-            analytics = model_data['analytics']
-            if 'evaluations' in analytics and benchmark in analytics['evaluations']:
-                return analytics['evaluations'][benchmark]
-        
-        return None
-    
-    def _calculate_recency_factor(self, model_data: Dict, benchmark: str) -> float:
-        """Calculate recency factor for a score"""
-        score_date = self._get_score_date(model_data, benchmark)
-        if not score_date:
-            return 0.8  # Default factor for unknown dates
-        
-        try:
-            date_obj = datetime.fromisoformat(score_date.replace('Z', '+00:00'))
-            age = datetime.now() - date_obj.replace(tzinfo=None)
-            
-            # Exponential decay: factor decreases over time
-            days_old = age.days
-            if days_old <= 30:
-                return 1.0
-            elif days_old <= 90:
-                return 0.9
-            elif days_old <= 180:
-                return 0.8
-            else:
-                return 0.7
+                    # Calculate confidence based on data availability
+                    category_scores[category] = CategoryScore(
+                        score=final_score,
+                        confidence=row_confidences[col],
+                        contributing_scores=contributing_scores,
+                        last_updated=last_updated
+                    )
                 
-        except Exception:
-            return 0.8
-    
-    def _get_quality_factor(self, model_data: Dict, benchmark: str) -> float:
-        """Get quality factor based on data source"""
-        source = self._get_score_source(model_data, benchmark)
-        
-        quality_factors = {
-            'static': 1.0,
-            'benchmarks': 0.9,
-            'analytics': 0.95
-        }
-        
-        return quality_factors.get(source, 0.8)
-    
-    def _get_score_source(self, model_data: Dict, benchmark: str) -> str:
-        """Determine the source of a score"""
-        if 'benchmarks' in model_data and model_data['benchmarks']:
-            bench_data = model_data['benchmarks']
-            if 'benchmarks' in bench_data and benchmark in bench_data['benchmarks']:
-                return 'benchmarks'
-        
-        if 'analytics' in model_data and model_data['analytics']:
-            analytics = model_data['analytics']
-            if 'evaluations' in analytics and benchmark in analytics['evaluations']:
-                return 'analytics'
-        
-        return 'unknown'
-    
-    def _get_score_date(self, model_data: Dict, benchmark: str) -> Optional[str]:
-        """Get the date of a score"""
-        # Try benchmarks data first
-        if 'benchmarks' in model_data and model_data['benchmarks']:
-            bench_data = model_data['benchmarks']
-            if 'benchmarks' in bench_data and benchmark in bench_data['benchmarks']:
-                score_info = bench_data['benchmarks'][benchmark]
-                if isinstance(score_info, dict):
-                    return score_info.get('date')
-        
-        # Try analytics metadata
-        if 'analytics' in model_data and model_data['analytics']:
-            analytics = model_data['analytics']
-            if 'metadata' in analytics:
-                return analytics['metadata'].get('last_updated')
+                results[model_id] = category_scores
+            except Exception as e:
+                logger.error(f"Failed to process model {model_id}: {e}")
+                continue
         
-        return None
+        return results
     
-    def _apply_formula(self, base_score: float, model_data: Dict, category: str, formula: str) -> float:
-        """Apply category-specific formula to calculate final score"""
-        static_data = model_data.get('static', {})
-        
-        if formula == "weighted_average":
-            return base_score
-        
-        elif formula == "weighted_average_with_context":
-            # Boost for larger context windows in reasoning tasks
-            context_window = static_data.get('context_window', 4096)
-            context_boost = min(0.1, (context_window - 4096) / 100000)  # Up to 10% boost
-            return min(100.0, base_score + (base_score * context_boost))
-        
-        elif formula == "interpolated_with_bonuses":
-            # Creative writing benefits from larger context and cost efficiency
-            context_window = static_data.get('context_window', 4096)
-            cost_per_1k = static_data.get('cost_in_per_1k', 0.01)
-            
-            context_bonus = min(10.0, (context_window - 4000) / 1000)  # Up to 10 points
-            cost_bonus = max(0.0, 5.0 - (cost_per_1k * 500))  # Up to 5 points for cheap models
-            
-            return min(100.0, base_score + context_bonus + cost_bonus)
-        
-        elif formula == "accuracy_with_latency_penalty":
-            # Question answering penalized by high latency
-            latency_ms = static_data.get('avg_latency_ms', 2000)
-            latency_penalty = max(0.0, (latency_ms - 1000) / 10000 * base_score)  # Up to score% penalty
-            return max(0.0, base_score - latency_penalty)
-        
-        elif formula == "conversational_with_efficiency":
-            # Chat benefits from low cost and low latency
-            cost_per_1k = static_data.get('cost_in_per_1k', 0.01)
-            latency_ms = static_data.get('avg_latency_ms', 2000)
-            
-            cost_factor = 1.0 + max(0.0, (0.005 - cost_per_1k) / 0.005 * 0.2)  # Up to 20% boost
-            speed_factor = 1.0 + max(0.0, (2000 - latency_ms) / 2000 * 0.1)  # Up to 10% boost
-            
-            return min(100.0, base_score * cost_factor * speed_factor)
-        
-        else:  # balanced_average and fallback
-            return base_score
+    @staticmethod
+    def _recency_factors(days_old: np.ndarray) -> np.ndarray:
+        """Recency factor for each score age in days; NaN marks an unknown date"""
+        factors = DECAY_FACTORS[np.searchsorted(DECAY_STEPS_DAYS, days_old)]
+        return np.where(np.isnan(days_old), UNKNOWN_DATE_FACTOR, factors)
 
 # Global instances
 static_manager = StaticDataManager()
@@ -868,6 +1145,24 @@ category_calculator = CategoryCalculator()
 
 # Global storage for consolidated models (fallback when Redis is not available)
 global_consolidated_models: Dict[str, EnhancedModel] = {}
+global_rankings: Dict[str, List[Dict[str, Any]]] = {}
+
+# Latest fetch from each source; a refresh of one source re-consolidates with the others
+source_data: Dict[str, Dict[str, Any]] = {"static": {}, "benchmarks": {}, "analytics": {}}
+refresh_tasks: List[asyncio.Task] = []
+# Serializes fetch + consolidate runs so an older run cannot finish last and overwrite a newer one
+consolidation_lock: Optional[asyncio.Lock] = None
+
+# Redis channel announcing each finished consolidation
+MODELS_UPDATED_CHANNEL = "models:updated"
+# Redis set of the model ids currently cached under model:{id}
+MODELS_INDEX_KEY = "models:index"
+# Commands buffered per pipeline round-trip when caching models
+REDIS_PIPELINE_BATCH = config.get('cache.redis.pipeline_batch', 500)
+
+# Category scoring is pure CPU; it runs in worker processes once the service starts
+SCORING_WORKERS = config.get('processing.max_workers', os.cpu_count() or 1)
+scoring_pool: Optional[ProcessPoolExecutor] = None
 
 # API Models
 class ConsolidationStatus(BaseModel):
@@ -902,8 +1197,7 @@ async def get_status():
         consolidated_count = 0
         if redis_client:
             try:
-                keys = redis_client.keys("model:*")
-                consolidated_count = len(keys)
+                consolidated_count = await redis_client.scard(MODELS_INDEX_KEY)
             except Exception as redis_error:
                 logger.warning(f"Redis error, falling back to global storage count: {redis_error}")
         
@@ -916,15 +1210,15 @@ async def get_status():
         data_sources_status = {
             "static": {
                 "quality": static_manager.data_quality,
-                "last_update": static_manager.last_update.isoformat() if static_manager.last_update else None
+                "last_update": static_manager.last_update_iso
             },
             "benchmarks": {
                 "quality": benchmark_manager.data_quality,
-                "last_update": benchmark_manager.last_update.isoformat() if benchmark_manager.last_update else None
+                "last_update": benchmark_manager.last_update_iso
             },
             "analytics": {
                 "quality": analytics_manager.data_quality,
-                "last_update": analytics_manager.last_update.isoformat() if analytics_manager.last_update else None
+                "last_update": analytics_manager.last_update_iso
             }
         }
         
@@ -956,9 +1250,9 @@ async def get_model_scores(model_id: str):
     try:
         # Try Redis first
         if redis_client:
-            cached_data = redis_client.get(f"model:{model_id}")
+            cached_data = await redis_client.get(f"model:{model_id}")
             if cached_data:
-                model_data = json.loads(cached_data)
+                model_data = orjson.loads(cached_data)
                 return ModelScoreResponse(
                     model_id=model_id,
                     category_scores=model_data.get('category_scores', {}),
@@ -992,130 +1286,126 @@ async def get_category_rankings(category: str, limit: int = 10):
         
         ranked_models = []
         
-        # Try Redis first
+        total_models = 0
+        
+        # Try Redis first: the category's sorted set, then one HMGET for the top entries
         if redis_client:
             try:
-                model_keys = redis_client.keys("model:*")
-                for key in model_keys:
-                    model_data = json.loads(redis_client.get(key))
-                    category_scores = model_data.get('category_scores', {})
-                    
-                    if category in category_scores:
-                        score_data = category_scores[category]
-                        ranked_models.append({
-                            'model_id': model_data['model_id'],
-                            'display_name': model_data.get('display_name', ''),
-                            'provider': model_data.get('provider', ''),
-                            'score': score_data['score'],
-                            'confidence': score_data['confidence']
-                        })
+                rank_key = f"rank:{category}"
+                total_models = await redis_client.zcard(rank_key)
+                top_ids = await redis_client.zrevrange(rank_key, 0, limit - 1) if total_models and limit > 0 else []
+                entries = await redis_client.hmget(f"rank_entries:{category}", top_ids) if top_ids else []
+                ranked_models = [orjson.loads(entry) for entry in entries if entry]
             except Exception as redis_error:
                 logger.warning(f"Redis error, falling back to global storage: {redis_error}")
         
-        # Fallback to global variable
+        # Fallback to the rankings precomputed at consolidation
         if not ranked_models:
-            global global_consolidated_models
-            for model_id, model_data in global_consolidated_models.items():
-                if category in model_data.category_scores:
-                    score_data = model_data.category_scores[category]
-                    ranked_models.append({
-                        'model_id': model_id,
-                        'display_name': model_data.display_name,
-                        'provider': model_data.provider,
-                        'score': score_data['score'],
-                        'confidence': score_data['confidence']
-                    })
-        
-        # Sort by score (descending) and limit results
-        ranked_models.sort(key=lambda x: x['score'], reverse=True)
-        limited_results = ranked_models[:limit]
+            category_rankings = global_rankings.get(category, [])
+            ranked_models = category_rankings[:limit]
+            total_models = len(category_rankings)
         
         return CategoryRankingResponse(
             category=category,
-            rankings=limited_results,
-            total_models=len(ranked_models)
+            rankings=ranked_models,
+            total_models=total_models
         )
         
     except Exception as e:
         logger.error(f"Failed to get rankings: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def get_consolidation_lock() -> asyncio.Lock:
+    """Consolidation lock, created on first use so it binds to the running loop"""
+    global consolidation_lock
+    if consolidation_lock is None:
+        consolidation_lock = asyncio.Lock()
+    return consolidation_lock
+
 async def consolidate_data():
     """Main data consolidation process"""
-    try:
+    async with get_consolidation_lock():
         logger.info("Starting data consolidation process...")
         
-        # Fetch data from all sources
-        static_data = await static_manager.fetch_data()
-        benchmark_data = await benchmark_manager.fetch_data()
-        analytics_data = await analytics_manager.fetch_data()
+        # Fetch data from all sources concurrently
+        results = await asyncio.gather(
+            static_manager.fetch_data(),
+            benchmark_manager.fetch_data(),
+            analytics_manager.fetch_data(),
+            return_exceptions=True
+        )
+        for source, result in zip(("static", "benchmarks", "analytics"), results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch {source} data: {result}")
+                result = {}
+            source_data[source] = result
+        
+        return await consolidate_sources()
+
+async def refresh_source_loop(source: str, manager: DataSourceManager, interval: float):
+    """Refresh one data source on its own cadence and re-consolidate"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with get_consolidation_lock():
+                source_data[source] = await manager.fetch_data()
+                await consolidate_sources()
+        except Exception:
+            logger.exception(f"Scheduled {source} refresh failed")
+
+async def consolidate_sources():
+    """Match and score the latest data from every source"""
+    try:
+        static_data = source_data["static"]
+        benchmark_data = source_data["benchmarks"]
+        analytics_data = source_data["analytics"]
         
         # Match models across sources
         matched_models = model_matcher.match_models(static_data, benchmark_data, analytics_data)
         
-        # Process each model
-        consolidated_models = {}
-        for model_id, model_sources in matched_models.items():
-            try:
-                # Calculate category scores
-                category_scores = category_calculator.calculate_scores(model_sources)
-                
-                if not category_scores:
-                    continue  # Skip models with no calculable scores
-                
-                # Create enhanced model data
-                enhanced_model = EnhancedModel(
-                    model_id=model_id,
-                    provider=model_sources['static'].get('provider', 'unknown'),
-                    display_name=model_sources['static'].get('display_name', model_id),
-                    static_data=model_sources['static'],
-                    category_scores={k: asdict(v) for k, v in category_scores.items()},
-                    data_provenance={
-                        'static': DataProvenance(
-                            source=static_manager.source_name,
-                            last_updated=static_manager.last_update.isoformat() if static_manager.last_update else '',
-                            data_quality=static_manager.data_quality
-                        ),
-                        'benchmarks': DataProvenance(
-                            source=benchmark_manager.source_name,
-                            last_updated=benchmark_manager.last_update.isoformat() if benchmark_manager.last_update else '',
-                            data_quality=benchmark_manager.data_quality
-                        ),
-                        'analytics': DataProvenance(
-                            source=analytics_manager.source_name,
-                            last_updated=analytics_manager.last_update.isoformat() if analytics_manager.last_update else '',
-                            data_quality=analytics_manager.data_quality
-                        )
-                    },
-                    performance_metadata=calculate_performance_metadata(category_scores),
-                    last_consolidated=datetime.now().isoformat(),
-                    overall_quality=calculate_overall_quality(model_sources)
-                )
-                
-                consolidated_models[model_id] = enhanced_model
-                
-                # Cache in Redis
-                if redis_client:
-                    redis_client.setex(
-                        f"model:{model_id}",
-                        config.get('cache.policies.models', 3600),
-                        json.dumps(asdict(enhanced_model))
-                    )
-                
-            except Exception as e:
-                logger.error(f"Failed to process model {model_id}: {e}")
-                continue
+        # Provenance reflects the managers' state in this process, so capture it for the workers
+        data_provenance = {
+            'static': DataProvenance(
+                source=static_manager.source_name,
+                last_updated=static_manager.last_update_iso or '',
+                data_quality=static_manager.data_quality
+            ),
+            'benchmarks': DataProvenance(
+                source=benchmark_manager.source_name,
+                last_updated=benchmark_manager.last_update_iso or '',
+                data_quality=benchmark_manager.data_quality
+            ),
+            'analytics': DataProvenance(
+                source=analytics_manager.source_name,
+                last_updated=analytics_manager.last_update_iso or '',
+                data_quality=analytics_manager.data_quality
+            )
+        }
+        
+        # Score and assemble the models off the event loop
+        consolidated_models = await consolidate_models(matched_models, data_provenance)
         
         logger.info(f"Consolidated {len(consolidated_models)} models successfully")
         
+        # Rank once per consolidation rather than on every /rankings request
+        rankings = build_rankings(consolidated_models)
+        
+        # Serialize each model once for both Redis and the output file; provenance is shared by the run
+        serialized_provenance = {k: v.to_dict() for k, v in data_provenance.items()}
+        serialized_models = {k: v.to_dict(serialized_provenance) for k, v in consolidated_models.items()}
+        
+        # Cache in Redis
+        if redis_client:
+            await cache_models(serialized_models, rankings)
+        
         # Store in global variable for API access
-        global global_consolidated_models
+        global global_consolidated_models, global_rankings
         global_consolidated_models = consolidated_models
+        global_rankings = rankings
         
         # Save consolidated data to file
         output_path = config.get('output.file_path', 'enhanced_models.json')
-        with open(output_path, 'w') as f:
-            json.dump({k: asdict(v) for k, v in consolidated_models.items()}, f, indent=2)
+        await asyncio.to_thread(_write_json, output_path, serialized_models)
         
         return consolidated_models
         
@@ -1123,21 +1413,169 @@ async def consolidate_data():
         logger.error(f"Data consolidation failed: {e}")
         raise
 
+def build_rankings(consolidated_models: Dict[str, EnhancedModel]) -> Dict[str, List[Dict[str, Any]]]:
+    """Models scored in each category, sorted by score (descending)"""
+    rankings = {}
+    for category in CLASSIFICATION_CATEGORIES:
+        ranked_models = [
+            {
+                'model_id': model_id,
+                'display_name': enhanced_model.display_name,
+                'provider': enhanced_model.provider,
+                'score': enhanced_model.category_scores[category]['score'],
+                'confidence': enhanced_model.category_scores[category]['confidence']
+            }
+            for model_id, enhanced_model in consolidated_models.items()
+            if category in enhanced_model.category_scores
+        ]
+        ranked_models.sort(key=lambda x: x['score'], reverse=True)
+        rankings[category] = ranked_models
+    return rankings
+
+async def cache_models(serialized_models: Dict[str, Dict[str, Any]], rankings: Dict[str, List[Dict[str, Any]]]):
+    """Write all models to Redis in pipelined batches and announce the update"""
+    try:
+        ttl = config.get('cache.policies.models', 3600)
+        pipe = redis_client.pipeline(transaction=False)
+        for count, (model_id, model_dict) in enumerate(serialized_models.items(), 1):
+            pipe.setex(f"model:{model_id}", ttl, orjson.dumps(model_dict))
+            # Flush periodically so a large catalogue doesn't buffer every payload at once
+            if count % REDIS_PIPELINE_BATCH == 0:
+                await pipe.execute()
+        
+        # Index of cached model ids, so readers never need KEYS model:*
+        if serialized_models:
+            staging_key = f"{MODELS_INDEX_KEY}:staging"
+            pipe.delete(staging_key)
+            pipe.sadd(staging_key, *serialized_models)
+            pipe.expire(staging_key, ttl)
+            pipe.rename(staging_key, MODELS_INDEX_KEY)
+        else:
+            pipe.delete(MODELS_INDEX_KEY)
+        
+        # Per-category sorted sets let /rankings read the top N without scanning models,
+        # and a hash of small ranking entries spares it parsing full model payloads
+        for category, ranked_models in rankings.items():
+            rank_key = f"rank:{category}"
+            entries_key = f"rank_entries:{category}"
+            if ranked_models:
+                # Build aside and swap in, so readers never see a partial ranking
+                rank_staging = f"{rank_key}:staging"
+                entries_staging = f"{entries_key}:staging"
+                pipe.delete(rank_staging, entries_staging)
+                pipe.zadd(rank_staging, {entry['model_id']: entry['score'] for entry in ranked_models})
+                pipe.hset(entries_staging, mapping={entry['model_id']: orjson.dumps(entry) for entry in ranked_models})
+                pipe.expire(rank_staging, ttl)
+                pipe.expire(entries_staging, ttl)
+                pipe.rename(rank_staging, rank_key)
+                pipe.rename(entries_staging, entries_key)
+            else:
+                pipe.delete(rank_key, entries_key)
+        
+        # Subscribers refresh once per consolidation rather than per model
+        pipe.publish(MODELS_UPDATED_CHANNEL, orjson.dumps({
+            "total_models": len(serialized_models),
+            "timestamp": datetime.now().isoformat()
+        }))
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to cache consolidated models in Redis: {e}")
+
+def _consolidate_batch(items: List[Tuple[str, Dict]], now_ts: float,
+                       data_provenance: Dict[str, DataProvenance]) -> Dict[str, EnhancedModel]:
+    """Score and assemble a batch of matched models (runs in a worker process)"""
+    try:
+        all_category_scores = category_calculator.calculate_all_scores(dict(items), now_ts)
+    except Exception as e:
+        logger.error(f"Failed to score batch of {len(items)} models: {e}")
+        return {}
+    now_iso = datetime.fromtimestamp(now_ts).isoformat()
+    
+    consolidated_models = {}
+    for model_id, model_sources in items:
+        try:
+            category_scores = all_category_scores.get(model_id)
+            
+            if not category_scores:
+                continue  # Skip models with no calculable scores
+            
+            # Create enhanced model data
+            consolidated_models[model_id] = EnhancedModel(
+                model_id=model_id,
+                provider=model_sources['static'].get('provider', 'unknown'),
+                display_name=model_sources['static'].get('display_name', model_id),
+                static_data=model_sources['static'],
+                category_scores={k: v.to_dict() for k, v in category_scores.items()},
+                data_provenance=data_provenance,
+                performance_metadata=calculate_performance_metadata(category_scores),
+                last_consolidated=now_iso,
+                overall_quality=model_sources['overall_quality']
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to process model {model_id}: {e}")
+            continue
+    
+    return consolidated_models
+
+async def consolidate_models(matched_models: Dict[str, Dict],
+                             data_provenance: Dict[str, DataProvenance]) -> Dict[str, EnhancedModel]:
+    """Consolidate all matched models, split into one batch per worker process"""
+    # Workers only need the formula inputs, the flattened scores and the source coverage
+    items = [
+        (model_id, {
+            'static': model_sources['static'],
+            'scores': model_sources['scores'],
+            'overall_quality': calculate_overall_quality(model_sources)
+        })
+        for model_id, model_sources in matched_models.items()
+    ]
+    
+    # Every batch ages and stamps models with the same instant
+    now_ts = time.time()
+    if scoring_pool is None:
+        return _consolidate_batch(items, now_ts, data_provenance)
+    
+    # One batch per worker keeps pickling overhead to a handful of round-trips
+    loop = asyncio.get_running_loop()
+    batches = [items[i::SCORING_WORKERS] for i in range(SCORING_WORKERS)]
+    results = await asyncio.gather(*[
+        loop.run_in_executor(scoring_pool, _consolidate_batch, batch, now_ts, data_provenance)
+        for batch in batches if batch
+    ])
+    
+    # Reassemble in match order
+    batch_models = {}
+    for result in results:
+        batch_models.update(result)
+    return {model_id: batch_models[model_id] for model_id in matched_models if model_id in batch_models}
+
 def calculate_performance_metadata(category_scores: Dict[str, CategoryScore]) -> Dict[str, Any]:
     """Calculate performance metadata for a model"""
     if not category_scores:
         return {}
     
-    # Find best and worst categories
-    scores_by_category = {cat: score.score for cat, score in category_scores.items()}
+    # One pass for the extremes and totals
+    score_items = []
+    max_score = -float('inf')
+    min_score = float('inf')
+    score_sum = confidence_sum = 0
+    for cat, score in category_scores.items():
+        value = score.score
+        score_items.append((cat, value))
+        max_score = max(max_score, value)
+        min_score = min(min_score, value)
+        score_sum += value
+        confidence_sum += score.confidence
     
-    best_categories = [cat for cat, score in scores_by_category.items() 
-                      if score >= max(scores_by_category.values()) - 5]
-    worst_categories = [cat for cat, score in scores_by_category.items() 
-                       if score <= min(scores_by_category.values()) + 10]
+    # Find best and worst categories
+    best_threshold = max_score - 5
+    worst_threshold = min_score + 10
+    best_categories = [cat for cat, value in score_items if value >= best_threshold]
+    worst_categories = [cat for cat, value in score_items if value <= worst_threshold]
     
     # Calculate overall performance tier
-    avg_score = sum(scores_by_category.values()) / len(scores_by_category)
+    avg_score = score_sum / len(score_items)
     performance_tier = "high" if avg_score >= 80 else "medium" if avg_score >= 60 else "low"
     
     return {
@@ -1146,7 +1584,7 @@ def calculate_performance_metadata(category_scores: Dict[str, CategoryScore]) ->
         "performance_tier": performance_tier,
         "overall_score": round(avg_score, 1),
         "category_breadth": len(category_scores),
-        "avg_confidence": round(sum(score.confidence for score in category_scores.values()) / len(category_scores), 2)
+        "avg_confidence": round(confidence_sum / len(score_items), 2)
     }
 
 def calculate_overall_quality(model_sources: Dict[str, Any]) -> float:
@@ -1170,7 +1608,7 @@ def calculate_overall_quality(model_sources: Dict[str, Any]) -> float:
 @app.on_event("startup")
 async def startup_event():
     """Initialize the service"""
-    global redis_client
+    global redis_client, redis_pool, scoring_pool
     
     logger.info("Starting Enhanced Ingestor Service...")
     
@@ -1178,17 +1616,55 @@ async def startup_event():
     try:
         redis_host = os.getenv('REDIS_HOST', config.get('cache.redis.host', 'localhost'))
         redis_port = int(os.getenv('REDIS_PORT', config.get('cache.redis.port', 6379)))
-        redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
-        redis_client.ping()  # Test connection
+        redis_pool = aioredis.ConnectionPool(
+            host=redis_host,
+            port=redis_port,
+            max_connections=config.get('cache.redis.max_connections', 32),
+            decode_responses=True
+        )
+        redis_client = aioredis.Redis(connection_pool=redis_pool)
+        await redis_client.ping()  # Test connection
         logger.info(f"Connected to Redis cache at {redis_host}:{redis_port}")
     except Exception as e:
         logger.warning(f"Failed to connect to Redis: {e}")
+        if redis_pool is not None:
+            await redis_pool.disconnect()
         redis_client = None
+        redis_pool = None
+    
+    # Compile the formula kernel before the first consolidation
+    apply_formula(0, 0.0, 4096.0, 0.01, 2000.0)
+    
+    # Forking now would copy the event loop and to_thread workers; start clean processes instead
+    scoring_pool = ProcessPoolExecutor(
+        max_workers=SCORING_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver")
+    )
     
     # Start initial data consolidation
     asyncio.create_task(consolidate_data())
+    
+    # Then keep each source fresh on its own schedule
+    refresh_intervals = [
+        ("static", static_manager, config.get('data_sources.static.refresh_interval', 86400)),
+        ("benchmarks", benchmark_manager, config.get('data_sources.scraped.refresh_interval', 3600)),
+        ("analytics", analytics_manager, config.get('data_sources.api.refresh_interval', 300))
+    ]
+    for source, manager, interval in refresh_intervals:
+        refresh_tasks.append(asyncio.create_task(refresh_source_loop(source, manager, interval)))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop refresh loops and release pooled connections and workers"""
+    for task in refresh_tasks:
+        task.cancel()
+    await analytics_manager.close()
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+    if scoring_pool is not None:
+        scoring_pool.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8001))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop")
\ No newline at end of file
@@ -4,8 +4,9 @@ Provides ingestor functionality without ML dependencies
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-import json
+import orjson
 import os
 import logging
 from typing import Dict, List, Any, Optional
@@ -15,7 +16,8 @@ from datetime import datetime
 app = FastAPI(
     title="Simple LLM Router Ingestor",
     description="Basic data ingestor service for testing",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Models
@@ -38,28 +40,37 @@ class ModelUpdateRequest(BaseModel):
 
 # Global data store
 models_data = []
+models_by_id: Dict[str, Dict[str, Any]] = {}
 last_sync_time = None
 
+def index_models(models: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map model id to model; the first entry wins, as with a linear scan"""
+    return {model["id"]: model for model in reversed(models)}
+
 def load_models_data():
     """Load initial models data"""
-    global models_data
+    global models_data, models_by_id
     
     # Try to load from the mounted models.json file
     models_path = os.environ.get("MODELS_JSON_PATH", "/app/data/models.json")
     
+    # One timestamp for the whole load
+    now_iso = datetime.now().isoformat()
+    
     try:
-        with open(models_path, 'r') as f:
-            data = json.load(f)
-            # Convert to our format
-            models_data = []
-            for model in data:
-                models_data.append({
-                    "id": model.get("id", "unknown"),
-                    "provider": model.get("provider", "unknown"),
-                    "display_name": model.get("display_name", model.get("id", "Unknown")),
-                    "status": "active",
-                    "last_updated": datetime.now().isoformat()
-                })
+        with open(models_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        # Convert to our format
+        models_data = [
+            {
+                "id": model.get("id", "unknown"),
+                "provider": model.get("provider", "unknown"),
+                "display_name": model.get("display_name", model.get("id", "Unknown")),
+                "status": "active",
+                "last_updated": now_iso
+            }
+            for model in data
+        ]
         logging.info(f"Loaded {len(models_data)} models from {models_path}")
         
     except FileNotFoundError:
@@ -71,26 +82,28 @@ def load_models_data():
                 "provider": "openai",
                 "display_name": "GPT-4",
                 "status": "active",
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now_iso
             },
             {
                 "id": "gpt-3.5-turbo",
                 "provider": "openai", 
                 "display_name": "GPT-3.5 Turbo",
                 "status": "active",
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now_iso
             },
             {
                 "id": "claude-3-sonnet",
                 "provider": "anthropic",
                 "display_name": "Claude 3 Sonnet", 
                 "status": "active",
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now_iso
             }
         ]
     except Exception as e:
         logging.error(f"Error loading models: {e}")
         models_data = []
+    
+    models_by_id = index_models(models_data)
 
 @app.on_event("startup")
 async def startup_event():
@@ -130,21 +143,24 @@ async def get_models():
 @app.post("/update")
 async def update_models(request: ModelUpdateRequest):
     """Update models data"""
-    global models_data, last_sync_time
+    global models_data, models_by_id, last_sync_time
     
     try:
-        # Simple update - replace existing data
-        models_data = []
-        for model_data in request.models:
-            models_data.append({
+        # Simple update - replace existing data, stamped with one timestamp
+        now_iso = datetime.now().isoformat()
+        models_data = [
+            {
                 "id": model_data.get("id", "unknown"),
-                "provider": model_data.get("provider", "unknown"), 
+                "provider": model_data.get("provider", "unknown"),
                 "display_name": model_data.get("display_name", model_data.get("id", "Unknown")),
                 "status": model_data.get("status", "active"),
-                "last_updated": datetime.now().isoformat()
-            })
+                "last_updated": now_iso
+            }
+            for model_data in request.models
+        ]
+        models_by_id = index_models(models_data)
         
-        last_sync_time = datetime.now().isoformat()
+        last_sync_time = now_iso
         
         return {
             "success": True,
@@ -159,11 +175,10 @@ async def update_models(request: ModelUpdateRequest):
 @app.get("/models/{model_id}")
 async def get_model(model_id: str):
     """Get specific model by ID"""
-    for model in models_data:
-        if model["id"] == model_id:
-            return model
-    
-    raise HTTPException(status_code=404, detail="Model not found")
+    model = models_by_id.get(model_id)
+    if model is None:
+        raise HTTPException(status_code=404, detail="Model not found")
+    return model
 
 if __name__ == "__main__":
     import uvicorn